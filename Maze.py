@@ -1,11 +1,407 @@
-from random import *
 import random
+from array import array
+import hashlib
+import heapq
+import mmap
+import os
+import struct
+import time
+import zlib
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+# Bits d'une cellule dans le tableau compact des passages
+EST = 1  # passage ouvert vers la cellule (l, c+1)
+SUD = 2  # passage ouvert vers la cellule (l+1, c)
+
+# Format binaire des fichiers de labyrinthe (voir Maze.save / Maze.load) :
+# signature, version, drapeaux (bit 0 : graine présente), hauteur, largeur, graine, longueur du nom de l'algorithme,
+# puis le nom de l'algorithme (UTF-8) et un octet par cellule
+_MAGIC          = b"AMAZE"
+_FORMAT_VERSION = 1
+_ENTETE         = struct.Struct("<5sBBQQqH")
+# En-tête d'un labyrinthe publié en mémoire partagée (voir Maze.share) : hauteur, largeur
+_ENTETE_PARTAGE = struct.Struct("<QQ")
+
+# Conversion d'une chaîne de bits aléatoires ('0'/'1') en passages
+_BITS_VERS_EST_OU_SUD = bytes.maketrans(b'01', bytes([SUD, EST]))
+_BITS_VERS_EST        = bytes.maketrans(b'01', bytes([0, EST]))
+
+# Export d'images : code de chaque bloc de pixels (0 : mur, 1 : sol, 2 : chemin) et couleurs associées
+_BLOC_MUR, _BLOC_SOL, _BLOC_CHEMIN = 0, 1, 2
+_BLOCS_EST = bytes.maketrans(bytes([0, EST, SUD, EST | SUD]), bytes([_BLOC_MUR, _BLOC_SOL, _BLOC_MUR, _BLOC_SOL]))
+_BLOCS_SUD = bytes.maketrans(bytes([0, EST, SUD, EST | SUD]), bytes([_BLOC_MUR, _BLOC_MUR, _BLOC_SOL, _BLOC_SOL]))
+_COULEURS_GRIS = (bytes.maketrans(b"\x00\x01\x02", b"\x00\xff\x80"),)
+_COULEURS_RVB  = (bytes.maketrans(b"\x00\x01\x02", b"\x00\xff\xff"),  # rouge
+                  bytes.maketrans(b"\x00\x01\x02", b"\x00\xff\x00"),  # vert
+                  bytes.maketrans(b"\x00\x01\x02", b"\x00\xff\x00"))  # bleu
+
+# Opérations groupées sur les murs (fill, empty, ChunkedMaze.window) : passages de chaque octet après l'opération
+_TOUS_FERMES = bytes.maketrans(bytes([0, EST, SUD, EST | SUD]), bytes([0, 0, 0, 0]))
+_TOUS_OUVERTS = bytes.maketrans(bytes([0, EST, SUD, EST | SUD]), bytes([EST | SUD] * 4))
+_SANS_EST = bytes.maketrans(bytes([0, EST, SUD, EST | SUD]), bytes([0, 0, SUD, SUD]))
+_SANS_SUD = bytes.maketrans(bytes([0, EST, SUD, EST | SUD]), bytes([0, EST, 0, EST]))
+_AVEC_EST = bytes.maketrans(bytes([0, EST, SUD, EST | SUD]), bytes([EST, EST, EST | SUD, EST | SUD]))
+_AVEC_SUD = bytes.maketrans(bytes([0, EST, SUD, EST | SUD]), bytes([SUD, EST | SUD, SUD, EST | SUD]))
+
+# Motifs du rendu texte : a/b (mur/passage EST) et c/d (mur/passage SUD)
+_MOTIF_CASES       = bytes.maketrans(bytes([0, EST, SUD, EST | SUD]), b'abab')
+_MOTIF_SEPARATIONS = bytes.maketrans(bytes([0, EST, SUD, EST | SUD]), b'ccdd')
+
+
+class _NeighborsView(Mapping):
+    """
+    Vue en lecture seule des voisinages d'un labyrinthe, calculée à la volée depuis le tableau compact des
+    passages. Elle se comporte comme l'ancien dictionnaire 'neighbors' (cellule -> ensemble des cellules
+    accessibles) mais ne peut pas être modifiée : il faut passer par add_wall/remove_wall.
+    """
+    def __init__(self, maze):
+        self._maze = maze
+
+    def __getitem__(self, c):
+        if c not in self:
+            raise KeyError(c)
+        return frozenset(self._maze.get_reachable_cells(c))
+
+    def __contains__(self, c):
+        try:
+            i, j = c
+        except (TypeError, ValueError):
+            return False
+        return 0 <= i < self._maze.height and 0 <= j < self._maze.width
+
+    def __iter__(self):
+        for i in range(self._maze.height):
+            for j in range(self._maze.width):
+                yield (i, j)
+
+    def __len__(self):
+        return self._maze.height * self._maze.width
+
+    def __repr__(self):
+        return repr({c: set(voisins) for c, voisins in self.items()})
+
+
+class Instrumentation:
+    """
+    Mesures facultatives des méthodes gen_* et solve_* : compteurs, chronomètres de phases et rappel à chaque étape.
+    On la passe aux méthodes gen_* (argument instrumentation) ou on l'attache à un labyrinthe
+    (maze.instrumentation = Instrumentation()) pour les méthodes solve_*. Sans instrumentation, les méthodes ne
+    paient qu'un test par étape.
+
+    Compteurs utilisés :
+      - walls_removed, random_draws : murs cassés et tirages aléatoires des générateurs
+      - walk_steps, walks, loop_erasures, longest_walk : marches aléatoires de gen_wilson
+      - cells_expanded, peak_frontier, solves : cellules développées, taille maximale de la frontière, recherches
+    Chronomètres : un par méthode (gen_wilson, solve_bfs...), et pour certaines méthodes un par phase :
+      - gen_fusion.shuffle (liste et mélange des murs), gen_fusion.merge (fusion des ensembles)
+      - gen_wilson.walk (marches aléatoires), gen_wilson.carve (murs cassés le long des marches)
+    Événements transmis au rappel callback(evenement, *cellules) :
+      - "passage" (c1, c2) : un mur est cassé (gen_fusion, gen_exploration, gen_wilson)
+      - "walk" (c) : la marche aléatoire de gen_wilson avance sur la cellule c
+      - "expand" (c) : un solveur développe la cellule c
+    """
+    def __init__(self, callback=None):
+        self.counters = {}
+        self.timers   = {}
+        self.callback = callback
+
+    def count(self, nom, valeur=1):
+        """
+        Ajoute valeur au compteur nom.
+        """
+        self.counters[nom] = self.counters.get(nom, 0) + valeur
+
+    def maximum(self, nom, valeur):
+        """
+        Remplace le compteur nom par valeur si valeur est plus grande.
+        """
+        if valeur > self.counters.get(nom, valeur - 1):
+            self.counters[nom] = valeur
+
+    def add_time(self, nom, secondes):
+        """
+        Ajoute une durée (en secondes) au chronomètre de la phase nom.
+        """
+        self.timers[nom] = self.timers.get(nom, 0.0) + secondes
+
+    @contextmanager
+    def phase(self, nom):
+        """
+        Chronomètre le bloc 'with' et ajoute sa durée à la phase nom.
+        """
+        debut = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.add_time(nom, time.perf_counter() - debut)
+
+    def as_dict(self):
+        """
+        Retourne les mesures sous forme de dictionnaire : {"counters": {...}, "timers": {...}}.
+        """
+        return {"counters": dict(self.counters), "timers": dict(self.timers)}
+
+
+def _phase(instrumentation, nom):
+    """
+    Chronomètre une phase (voir Instrumentation.phase), ou ne fait rien si instrumentation vaut None.
+    """
+    return nullcontext() if instrumentation is None else instrumentation.phase(nom)
+
+
+class _CountedRandom:
+    """
+    Générateur aléatoire qui compte les tirages d'un autre (pour Instrumentation) sans changer leurs résultats.
+    """
+    def __init__(self, rng):
+        self.rng = rng
+        self.tirages = 0
+
+    def random(self):
+        self.tirages += 1
+        return self.rng.random()
+
+    def getrandbits(self, k):
+        self.tirages += 1
+        return self.rng.getrandbits(k)
+
+
+class _UnionFind:
+    """
+    Structure union-find (ensembles disjoints) sur les entiers 0..n-1, avec compression de chemin
+    et union par rang. Les parents sont stockés dans un tableau d'entiers et les rangs dans un bytearray.
+    """
+    def __init__(self, n):
+        self.parent = array('l', range(n))
+        self.rang   = bytearray(n)
+
+    def find(self, x):
+        """
+        Retourne le représentant de l'ensemble contenant x (en compressant le chemin parcouru).
+        """
+        parent = self.parent
+        racine = x
+        while parent[racine] != racine:
+            racine = parent[racine]
+        while parent[x] != racine:
+            parent[x], x = racine, parent[x]
+        return racine
+
+    def union(self, x, y):
+        """
+        Réunit les ensembles contenant x et y.
+
+        Retour :
+            True si les deux ensembles étaient distincts, False sinon
+        """
+        rx = self.find(x)
+        ry = self.find(y)
+        if rx == ry:
+            return False
+        rang = self.rang
+        if rang[rx] < rang[ry]:
+            rx, ry = ry, rx
+        self.parent[ry] = rx
+        if rang[rx] == rang[ry]:
+            rang[rx] += 1
+        return True
+
+
+class _TreeIndex:
+    """
+    Index d'un labyrinthe parfait (arbre couvrant) : l'arbre est enraciné, la profondeur de chaque cellule est
+    mémorisée, ainsi que ses ancêtres à distance 1, 2, 4, 8... (binary lifting). Le plus proche ancêtre commun de
+    deux cellules, et donc leur distance, s'obtient alors en O(log n).
+    """
+    def __init__(self, maze, racine):
+        n = maze.height * maze.width
+        # identifiants et profondeurs < n < 2**31 : des entiers sur 4 octets suffisent
+        parent = array('i', [-1]) * n
+        profondeur = array('i', [0]) * n
+        parent[racine] = racine
+        marque = deque([racine])
+        visitees = 0
+        while marque:
+            k = marque.popleft()
+            visitees += 1
+            d = profondeur[k] + 1
+            for v in maze._reachable_ids(k):
+                if parent[v] < 0:
+                    parent[v] = k
+                    profondeur[v] = d
+                    marque.append(v)
+        passages = maze._passage_count()
+        if visitees != n or passages != n - 1:
+            raise ValueError("Le labyrinthe n'est pas parfait : impossible de construire l'index d'arbre")
+        self.profondeur = profondeur
+        self.ancetres = [parent]  # ancetres[j][k] : ancêtre de k à distance 2**j (la racine est son propre parent)
+        while (1 << len(self.ancetres)) < n:
+            precedent = self.ancetres[-1]
+            self.ancetres.append(array('i', map(precedent.__getitem__, precedent)))
+
+    def lca(self, a, b):
+        """
+        Retourne l'identifiant du plus proche ancêtre commun des cellules a et b (identifiants).
+        """
+        profondeur = self.profondeur
+        if profondeur[a] < profondeur[b]:
+            a, b = b, a
+        ecart = profondeur[a] - profondeur[b]
+        j = 0
+        while ecart:
+            if ecart & 1:
+                a = self.ancetres[j][a]
+            ecart >>= 1
+            j += 1
+        if a == b:
+            return a
+        for niveau in reversed(self.ancetres):
+            if niveau[a] != niveau[b]:
+                a = niveau[a]
+                b = niveau[b]
+        return self.ancetres[0][a]
+
+    def distance(self, a, b):
+        """
+        Retourne le nombre de passages entre les cellules a et b (identifiants).
+        """
+        return self.profondeur[a] + self.profondeur[b] - 2 * self.profondeur[self.lca(a, b)]
+
+    def path(self, a, b):
+        """
+        Retourne le chemin de a vers b (identifiants) au format des méthodes solve_* :
+        de b jusqu'à la cellule qui suit a.
+        """
+        ancetre = self.lca(a, b)
+        parent = self.ancetres[0]
+        cote_a = []
+        while a != ancetre:
+            cote_a.append(a)
+            a = parent[a]
+        cote_b = []
+        while b != ancetre:
+            cote_b.append(b)
+            b = parent[b]
+        chemin = cote_b + [ancetre] + cote_a[::-1]
+        chemin.pop()  # la cellule de départ ne fait pas partie du chemin
+        return chemin
+
+
+class _ConnectivityIndex:
+    """
+    Composantes connexes d'un labyrinthe, tenues à jour à chaque ouverture ou fermeture de passage.
+    Chaque cellule porte l'étiquette de sa composante (tableau 'etiquettes'), 'tailles' associe à chaque étiquette
+    le nombre de cellules de la composante.
+      - ouverture d'un passage entre deux composantes : on réétiquette la plus petite (chaque cellule change au plus
+        log2(n) fois d'étiquette au fil des fusions)
+      - fermeture d'un passage : deux parcours en largeur alternés partent des deux cellules ; si l'un rencontre
+        l'autre, rien ne change, sinon le premier qui s'épuise a parcouru la plus petite des deux nouvelles
+        composantes, qui reçoit une nouvelle étiquette
+    """
+    def __init__(self, maze):
+        self.maze = maze
+        self.rebuild()
+
+    def rebuild(self):
+        """
+        Recalcule toutes les composantes en un seul parcours du labyrinthe.
+        """
+        maze = self.maze
+        n = maze.height * maze.width
+        etiquettes = array('l', [-1]) * n
+        tailles = {}
+        voisines = maze._reachable_ids
+        for source in range(n):
+            if etiquettes[source] >= 0:
+                continue
+            etiquettes[source] = source
+            pile = [source]
+            taille = 0
+            while pile:
+                k = pile.pop()
+                taille += 1
+                for v in voisines(k):
+                    if etiquettes[v] < 0:
+                        etiquettes[v] = source
+                        pile.append(v)
+            tailles[source] = taille
+        self.etiquettes = etiquettes
+        self.tailles = tailles
+        self.suivante = n  # prochaine étiquette libre
+
+    def opened(self, a, b):
+        """
+        Met l'index à jour après l'ouverture du passage entre les cellules d'identifiants a et b.
+        """
+        etiquettes = self.etiquettes
+        ea, eb = etiquettes[a], etiquettes[b]
+        if ea == eb:
+            return
+        if self.tailles[ea] >= self.tailles[eb]:
+            grande, petite, depart = ea, eb, b
+        else:
+            grande, petite, depart = eb, ea, a
+        # parcours de la plus petite composante seulement, depuis son extrémité du passage : elle prend l'étiquette
+        # de la plus grande
+        voisines = self.maze._reachable_ids
+        etiquettes[depart] = grande
+        pile = [depart]
+        while pile:
+            for v in voisines(pile.pop()):
+                if etiquettes[v] == petite:
+                    etiquettes[v] = grande
+                    pile.append(v)
+        self.tailles[grande] += self.tailles.pop(petite)
+
+    def closed(self, a, b):
+        """
+        Met l'index à jour après la fermeture du passage entre les cellules d'identifiants a et b.
+        """
+        voisines = self.maze._reachable_ids
+        vus = ({a}, {b})
+        files = (deque([a]), deque([b]))
+        cote = 0
+        while True:
+            file, vus_ici, vus_autre = files[cote], vus[cote], vus[1 - cote]
+            if not file:
+                break  # ce côté est épuisé : c'est une composante à part
+            for v in voisines(file.popleft()):
+                if v in vus_autre:
+                    return  # les deux cellules sont toujours reliées
+                if v not in vus_ici:
+                    vus_ici.add(v)
+                    file.append(v)
+            cote = 1 - cote
+        etiquettes = self.etiquettes
+        ancienne = etiquettes[a]
+        nouvelle = self.suivante
+        self.suivante += 1
+        for k in vus[cote]:
+            etiquettes[k] = nouvelle
+        self.tailles[ancienne] -= len(vus[cote])
+        self.tailles[nouvelle] = len(vus[cote])
+
+    def connected(self, a, b):
+        return self.etiquettes[a] == self.etiquettes[b]
+
+    def component_count(self):
+        return len(self.tailles)
+
+
 class Maze:
     """
     Classe Labyrinthe
     Représentation sous forme de graphe non-orienté
     dont chaque sommet est une cellule (un tuple (l,c))
-    et dont la structure est représentée par un dictionnaire
+    La structure est stockée de façon compacte dans un bytearray '_cells' :
+      - la cellule (l, c) a pour identifiant l * width + c
+      - chaque octet contient deux bits : EST si le passage vers (l, c+1) est ouvert,
+        SUD si le passage vers (l+1, c) est ouvert
+    L'attribut 'neighbors' reste disponible sous forme de vue en lecture seule
       - clés : sommets
       - valeurs : ensemble des sommets voisins accessibles
     """
@@ -13,22 +409,101 @@ class Maze:
         """
         Constructeur d'un labyrinthe de height cellules de haut
         et de width cellules de large
-        Les voisinages sont initialisés à des ensembles vides
+        Les passages sont initialisés à 0 (aucun passage ouvert)
         Remarque : dans le labyrinthe créé, chaque cellule est complètement emmurée
         """
+        cells = bytearray(height * width)
+        if empty and height > 0 and width > 0:
+            ligne = bytes([EST | SUD] * (width - 1) + [SUD])
+            cells[:] = ligne * (height - 1) + bytes([EST] * (width - 1) + [0])
+        self._setup(height, width, cells)
+
+    def _setup(self, height, width, cells):
+        """
+        Initialise les attributs d'un labyrinthe à partir de son tableau de passages.
+
+        Arguments :
+            height (int) : nombre de ligne(s) du labyrinthe
+            width (int) : nombre de colonne(s) du labyrinthe
+            cells : tableau de height * width octets (bytearray, ou memoryview sur un fichier projeté en mémoire)
+        """
         self.height    = height
         self.width     = width
-        self.neighbors = {(i, j): set() for i in range(height) for j in range(width)}
-        if empty :
-            for i in range(self.width):
-                for b in range(self.height - 1):
-                    self.neighbors[(b, i)].add((b + 1, i))
-                    self.neighbors[(b + 1, i)].add((b, i))
-            for b in range(self.height):
-                for i in range(self.width - 1):
-                    self.neighbors[(b, i)].add((b, i+1))
-                    self.neighbors[(b, i+1)].add((b, i))
+        self._cells    = cells
+        self.algorithm = None  # nom de l'algorithme de génération (gen_*)
+        self.seed      = None  # graine utilisée pour la génération, si elle est connue
+        # Cache LRU des champs de distances (identifiant de la source -> distances depuis la source)
+        self._distances          = OrderedDict()
+        self.distance_cache_size = 16
+        self.distance_cache_bytes = 64 * 2 ** 20  # mémoire maximale des champs en cache (4 octets par cellule)
+        self.cache_hits          = 0
+        self.cache_misses        = 0
+        self._tree               = None  # index d'arbre (voir build_tree_index)
+        self.expanded            = 0     # nombre de cellules développées par le dernier appel à solve_*
+        self.instrumentation     = None  # mesures facultatives (voir Instrumentation)
+        self._connectivity       = None  # index des composantes connexes (voir build_connectivity_index)
+
+    @classmethod
+    def _from_cells(self, height, width, cells):
+        """
+        Construit un labyrinthe directement à partir d'un tableau de passages existant (sans copie).
+        """
+        labyrinthe = Maze.__new__(Maze)
+        labyrinthe._setup(height, width, cells)
+        return labyrinthe
+
+    def __getstate__(self):
+        """
+        État transmis par pickle : seulement les dimensions, les passages (un octet par cellule), l'algorithme et la
+        graine ; les caches ne sont pas transmis.
+        """
+        return {"height": self.height, "width": self.width, "cells": bytes(self._cells),
+                "algorithm": self.algorithm, "seed": self.seed}
+
+    def __setstate__(self, etat):
+        self._setup(etat["height"], etat["width"], bytearray(etat["cells"]))
+        self.algorithm = etat["algorithm"]
+        self.seed = etat["seed"]
+
+    @property
+    def neighbors(self):
+        """
+        Vue en lecture seule des voisinages (dictionnaire cellule -> ensemble des cellules accessibles)
+        """
+        return _NeighborsView(self)
+
+    def _modified(self):
+        """
+        Invalide les données calculées à partir des murs (à appeler après toute modification des passages).
+        """
+        if self._distances:
+            self._distances.clear()
+        self._tree = None
+
+    def _passage(self, c1, c2):
+        """
+        Retourne l'emplacement du passage entre deux cellules contigües.
+
+        Arguments :
+            c1 (tuple) : Coordonnée de la première cellule (ligne, colonne)
+            c2 (tuple) : Coordonnée de la deuxième cellule (ligne, colonne)
 
+        Retour :
+            (indice, bit) : identifiant de la cellule la plus au nord/ouest et bit (EST ou SUD) du passage,
+            ou None si les deux cellules ne sont pas contigües
+        """
+        (i1, j1), (i2, j2) = c1, c2
+        if i1 == i2:
+            if j2 == j1 + 1:
+                return i1 * self.width + j1, EST
+            if j1 == j2 + 1:
+                return i2 * self.width + j2, EST
+        elif j1 == j2:
+            if i2 == i1 + 1:
+                return i1 * self.width + j1, SUD
+            if i1 == i2 + 1:
+                return i2 * self.width + j2, SUD
+        return None
 
     def info(self):
         """
@@ -53,40 +528,64 @@ class Maze:
         txt += "- Structure cohérente\n" if valid else f"- Structure incohérente : {c1} X {c2}\n"
         return txt
 
+    def validate(self):
+        """
+        Vérifie la structure du labyrinthe en un parcours linéaire et indique s'il est parfait.
+
+        Vérifications :
+          - taille du tableau des passages (height * width octets) et octets valides (seuls les bits EST et SUD) ;
+          - aucun passage ne sort de la grille (pas de bit EST sur la dernière colonne, ni SUD sur la dernière ligne).
+            Chaque passage n'étant stocké qu'une fois, entre deux cellules contigües, ces tests suffisent à garantir
+            la symétrie et la contiguïté de tous les passages ;
+          - nombre de passages et de composantes connexes : le labyrinthe est connexe s'il n'a qu'une composante,
+            sans cycle si passages == cellules - composantes, et parfait s'il est les deux (passages == cellules - 1).
+
+        Retour :
+            dictionnaire : valid (structure correcte), cells, passages, components, connected, acyclic, perfect et
+            errors (liste des problèmes rencontrés) ; si la structure est incorrecte, les tests de graphe ne sont pas
+            faits (components vaut None, connected, acyclic et perfect valent False)
+        """
+        h, w = self.height, self.width
+        n = h * w
+        cells = self._cells
+        erreurs = []
+        if len(cells) != n:
+            erreurs.append(f"le tableau des passages contient {len(cells)} octets au lieu de {n}")
+        else:
+            inconnus = len(bytes(cells).translate(None, bytes([0, EST, SUD, EST | SUD])))
+            if inconnus:
+                erreurs.append(f"{inconnus} cellule(s) avec des bits autres que EST et SUD")
+            if w > 0:
+                bord_est = bytes(cells[w - 1::w])
+                sortants = bord_est.count(EST) + bord_est.count(EST | SUD)
+                if sortants:
+                    erreurs.append(f"{sortants} passage(s) EST sortent de la grille (dernière colonne)")
+            if h > 0:
+                bord_sud = bytes(cells[(h - 1) * w:])
+                sortants = bord_sud.count(SUD) + bord_sud.count(EST | SUD)
+                if sortants:
+                    erreurs.append(f"{sortants} passage(s) SUD sortent de la grille (dernière ligne)")
+        resultat = {"valid": not erreurs, "cells": n, "passages": None, "components": None,
+                    "connected": False, "acyclic": False, "perfect": False, "errors": erreurs}
+        if erreurs:
+            return resultat
+        passages = self._passage_count()
+        index = self._connectivity if self._connectivity is not None else _ConnectivityIndex(self)
+        composantes = index.component_count()
+        resultat["passages"] = passages
+        resultat["components"] = composantes
+        resultat["connected"] = composantes <= 1
+        resultat["acyclic"] = passages == n - composantes
+        resultat["perfect"] = resultat["connected"] and resultat["acyclic"]
+        return resultat
+
     def __str__(self):
         """
-        **NE PAS MODIFIER CETTE MÉTHODE**
         Représentation textuelle d'un objet Maze (en utilisant des caractères ascii)
         Retour:
              chaîne (str) : chaîne de caractères représentant le labyrinthe
         """
-        txt = ""
-        # Première ligne
-        txt += "┏"
-        for j in range(self.width-1):
-            txt += "━━━┳"
-        txt += "━━━┓\n"
-        txt += "┃"
-        for j in range(self.width-1):
-            txt += "   ┃" if (0,j+1) not in self.neighbors[(0,j)] else "    "
-        txt += "   ┃\n"
-        # Lignes normales
-        for i in range(self.height-1):
-            txt += "┣"
-            for j in range(self.width-1):
-                txt += "━━━╋" if (i+1,j) not in self.neighbors[(i,j)] else "   ╋"
-            txt += "━━━┫\n" if (i+1,self.width-1) not in self.neighbors[(i,self.width-1)] else "   ┫\n"
-            txt += "┃"
-            for j in range(self.width):
-                txt += "   ┃" if (i+1,j+1) not in self.neighbors[(i+1,j)] else "    "
-            txt += "\n"
-        # Bas du tableau
-        txt += "┗"
-        for i in range(self.width-1):
-            txt += "━━━┻"
-        txt += "━━━┛\n"
-
-        return txt
+        return "".join(Maze._text_lines(self._rows(), self.width))
 
     def add_wall(self, c1, c2):
         """
@@ -106,10 +605,14 @@ class Maze:
                0 <= c2[1] < self.width, \
             f"Erreur lors de l'ajout d'un mur entre {c1} et {c2} : les coordonnées de sont pas compatibles avec les dimensions du labyrinthe"
         # Ajout du mur
-        if c2 in self.neighbors[c1]:  # Si c2 est dans les voisines de c1
-            self.neighbors[c1].remove(c2)  # on le retire
-        if c1 in self.neighbors[c2]:  # Si c3 est dans les voisines de c2
-            self.neighbors[c2].remove(c1)  # on le retire
+        passage = self._passage(c1, c2)
+        if passage is not None:  # Si c1 et c2 sont contigües
+            k, bit = passage
+            ouvert = self._cells[k] & bit
+            self._cells[k] &= ~bit & 0xFF  # on ferme le passage
+            self._modified()
+            if ouvert and self._connectivity is not None:
+                self._connectivity.closed(k, k + 1 if bit == EST else k + self.width)
 
     def remove_wall(self, c1, c2):
         """
@@ -127,10 +630,14 @@ class Maze:
                0 <= c2[0] < self.height and \
                0 <= c2[1] < self.width, \
             f"Erreur lors de la supression d'un mur entre {c1} et {c2} : les coordonnées de sont pas compatibles avec les dimensions du labyrinthe"
-        if c2 not in self.neighbors[c1]:
-            self.neighbors[c1].add(c2)
-        if c1 not in self.neighbors[c2]:
-            self.neighbors[c2].add(c1)
+        passage = self._passage(c1, c2)
+        if passage is not None:
+            k, bit = passage
+            ferme = not self._cells[k] & bit
+            self._cells[k] |= bit
+            self._modified()
+            if ferme and self._connectivity is not None:
+                self._connectivity.opened(k, k + 1 if bit == EST else k + self.width)
 
     def get_walls(self):
         """
@@ -144,49 +651,264 @@ class Maze:
           Exemple du tuple : ((ligne1, colonne1), (ligne2, colonne2))
         """
         liste_murs=[]
+        cells = self._cells
+        w = self.width
         for i in range (self.width):
             for b in range (self.height-1):
-                if (b,i) not in self.neighbors[(b+1,i)]:
+                if not cells[b*w+i] & SUD:
                     liste_murs.append([(b,i),(b+1,i)])
         for b in range (self.height):
             for i in range (self.width-1):
-                if (b,i) not in self.neighbors[(b,i+1)]:
+                if not cells[b*w+i] & EST:
                     liste_murs.append([(b,i),(b,i+1)])
         return liste_murs
 
-    def fill(self):
+    def _open_passage(self, a, b):
+        """
+        Ouvre le passage entre deux cellules contigües données par leurs identifiants.
+
+        Arguments :
+            a (int) : identifiant de la première cellule
+            b (int) : identifiant de la deuxième cellule
+
+        Retour :
+            Rien
+        """
+        if b == a + self.width:
+            self._cells[a] |= SUD
+        elif a == b + self.width:
+            self._cells[b] |= SUD
+        elif b == a + 1:
+            self._cells[a] |= EST
+        else:
+            self._cells[b] |= EST
+
+    def _report_generation(self, instrumentation, debut, tirages=None, **compteurs):
+        """
+        Transmet à l'instrumentation (si elle existe) les mesures d'une génération commencée à l'instant debut.
+        """
+        if instrumentation is None:
+            return
+        self.instrumentation = instrumentation
+        instrumentation.add_time("gen_" + self.algorithm, time.perf_counter() - debut)
+        instrumentation.count("walls_removed", self._passage_count())
+        if tirages is not None:
+            instrumentation.count("random_draws", tirages)
+        for nom, valeur in compteurs.items():
+            if nom == "longest_walk":
+                instrumentation.maximum(nom, valeur)
+            else:
+                instrumentation.count(nom, valeur)
+
+    def _report_solve(self, phase, debut, developpees, pic):
+        """
+        Transmet à l'instrumentation du labyrinthe les mesures d'une recherche commencée à l'instant debut.
+        """
+        instrumentation = self.instrumentation
+        instrumentation.add_time(phase, time.perf_counter() - debut)
+        instrumentation.count("solves")
+        instrumentation.count("cells_expanded", developpees)
+        instrumentation.maximum("peak_frontier", pic)
+
+    def _passage_count(self):
+        """
+        Retourne le nombre de passages ouverts du labyrinthe (compté par blocs, sans copier tout le tableau).
+        """
+        nombre = 0
+        bloc = 1 << 20
+        for debut in range(0, len(self._cells), bloc):
+            morceau = bytes(self._cells[debut:debut + bloc])
+            nombre += morceau.count(EST) + morceau.count(SUD) + 2 * morceau.count(EST | SUD)
+        return nombre
+
+    def _reachable_ids(self, k):
+        """
+        Retourne les identifiants des cellules accessibles depuis la cellule d'identifiant k
+        (dans le même ordre que get_reachable_cells : SUD, NORD, EST, OUEST).
+        """
+        w = self.width
+        cells = self._cells
+        c = cells[k]
+        voisines = []
+        if c & SUD:
+            voisines.append(k + w)
+        if k >= w and cells[k - w] & SUD:
+            voisines.append(k - w)
+        if c & EST:
+            voisines.append(k + 1)
+        if k % w and cells[k - 1] & EST:
+            voisines.append(k - 1)
+        return voisines
+
+    def _wall_ids(self):
+        """
+        Retourne les murs intérieurs du labyrinthe sous forme d'identifiants entiers (voir iter_walls).
+
+        Retour :
+            array d'entiers contenant les identifiants des murs
+        """
+        return array('l', self.iter_walls())
+
+    def iter_walls(self):
+        """
+        Parcourt les murs intérieurs du labyrinthe sans construire de liste, sous forme d'identifiants entiers.
+        Le mur d'identifiant e sépare la cellule k = e // 2 de sa voisine de l'EST (si e est pair)
+        ou de sa voisine du SUD (si e est impair) ; voir edge_id et edge_cells.
+
+        Retour :
+            Générateur des identifiants des murs, par ordre croissant
+        """
+        cells = self._cells
+        w = self.width
+        n = self.height * w
+        for k in range(n):
+            if k % w != w - 1 and not cells[k] & EST:
+                yield 2 * k
+            if k + w < n and not cells[k] & SUD:
+                yield 2 * k + 1
+
+    def wall_count(self):
+        """
+        Retourne le nombre de murs intérieurs du labyrinthe (sans les parcourir un par un).
+        """
+        h, w = self.height, self.width
+        if h == 0 or w == 0:
+            return 0
+        return h * (w - 1) + (h - 1) * w - self._passage_count()
+
+    def walls_array(self):
+        """
+        Retourne les murs intérieurs sous forme d'un tableau numpy (k, 2) : chaque ligne contient les identifiants
+        (l * width + c) des deux cellules séparées par un mur, dans l'ordre de iter_walls.
+        Nécessite numpy (sans numpy, utiliser iter_walls).
+
+        Exemple :
+            >>> Maze(2, 2, False).walls_array().tolist()
+            [[0, 1], [0, 2], [1, 3], [2, 3]]
+        """
+        try:
+            import numpy  # importé ici seulement : numpy n'est pas nécessaire au reste du module
+        except ImportError:
+            raise ImportError("walls_array nécessite numpy (sinon, utiliser iter_walls)") from None
+        h, w = self.height, self.width
+        cells = numpy.frombuffer(self._cells, dtype=numpy.uint8).reshape(h, w)
+        ids = numpy.arange(h * w, dtype=numpy.int64).reshape(h, w)
+        murs_est = 2 * ids[:, :-1][(cells[:, :-1] & EST) == 0]
+        murs_sud = 2 * ids[:-1, :][(cells[:-1, :] & SUD) == 0] + 1
+        murs = numpy.sort(numpy.concatenate((murs_est, murs_sud)))
+        k = murs >> 1
+        return numpy.stack((k, k + numpy.where(murs & 1, w, 1)), axis=1)
+
+    def edge_id(self, c1, c2):
+        """
+        Retourne l'identifiant du mur (ou du passage) entre deux cellules contigües.
+
+        Arguments :
+            c1 (tuple) : Coordonnée de la première cellule (ligne, colonne)
+            c2 (tuple) : Coordonnée de la deuxième cellule (ligne, colonne)
+
+        Retour :
+            identifiant entier (voir iter_walls), None si les cellules ne sont pas contigües
+        """
+        passage = self._passage(c1, c2)
+        if passage is None:
+            return None
+        k, bit = passage
+        return 2 * k + (bit == SUD)
+
+    def edge_cells(self, e):
+        """
+        Retourne les deux cellules séparées par le mur (ou le passage) d'identifiant e.
+        """
+        k = e >> 1
+        voisine = k + self.width if e & 1 else k + 1
+        return divmod(k, self.width), divmod(voisine, self.width)
+
+    def toggle_walls(self, ids):
+        """
+        Inverse d'un coup une série de murs : chaque mur est ouvert s'il était fermé et fermé s'il était ouvert.
+        Les caches sont invalidés une seule fois et l'index des composantes (voir build_connectivity_index)
+        est reconstruit en un seul parcours.
+
+        Argument :
+            ids : itérable d'identifiants de murs intérieurs (voir iter_walls, edge_id)
+
+        Retour :
+            Rien (lève ValueError, sans rien modifier, si un identifiant n'est pas celui d'un mur intérieur)
+        """
+        cells = self._cells
+        w = self.width
+        n = self.height * w
+        ids = list(ids)
+        for e in ids:
+            k = e >> 1
+            if not (0 <= k and (k + w < n if e & 1 else k < n and k % w != w - 1)):
+                raise ValueError(f"{e} n'est pas l'identifiant d'un mur intérieur du labyrinthe")
+        for e in ids:
+            cells[e >> 1] ^= SUD if e & 1 else EST
+        self._bulk_modified()
+
+    def _bulk_modified(self):
+        """
+        Invalide les caches après une opération groupée et reconstruit l'index des composantes s'il existe.
+        """
+        self._modified()
+        if self._connectivity is not None:
+            self._connectivity.rebuild()
+
+    def _apply_region(self, region, interieur, colonne_droite, derniere_ligne):
+        """
+        Applique une table de conversion des octets aux cellules d'une région rectangulaire, ligne par ligne :
+        'interieur' aux cellules dont les murs EST et SUD sont dans la région, 'colonne_droite' à la dernière colonne
+        (seul le mur SUD est dans la région) et 'derniere_ligne' à la dernière ligne (seul le mur EST).
+        """
+        if region is None:
+            region = (0, 0, self.height, self.width)
+        top, left, hauteur, largeur = region
+        if not (0 <= top and 0 <= left and 0 <= hauteur and 0 <= largeur
+                and top + hauteur <= self.height and left + largeur <= self.width):
+            raise ValueError(f"la région {region} n'est pas comprise dans le labyrinthe")
+        if hauteur == 0 or largeur == 0:
+            return
+        cells = self._cells
+        w = self.width
+        for i in range(top, top + hauteur):
+            debut = i * w + left
+            fin = debut + largeur - 1  # dernière colonne de la région
+            if i < top + hauteur - 1:
+                cells[debut:fin] = bytes(cells[debut:fin]).translate(interieur)
+                cells[fin] = colonne_droite[cells[fin]]
+            else:
+                cells[debut:fin] = bytes(cells[debut:fin]).translate(derniere_ligne)
+        self._bulk_modified()
+
+    def fill(self, region=None):
         """
         Enlève tous les murs du labyrinthe afin de le remplir entièrement.
+        Tous les passages sont fermés d'un coup (une opération par ligne), sur toute la grille ou seulement entre
+        les cellules d'une région rectangulaire (les murs du tour de la région ne changent pas).
 
         Argument :
-            Aucun
+            region (tuple) : (ligne, colonne, hauteur, largeur) de la région (None : tout le labyrinthe)
 
         Retour :
-            Rien
+            Rien (lève ValueError, sans rien modifier, si la région déborde du labyrinthe)
         """
-        for i in range(self.width):
-            for b in range(self.height - 1):
-                    self.add_wall((b, i), (b + 1, i))
-        for b in range(self.height):
-            for i in range(self.width - 1):
-                    self.add_wall((b, i), (b, i + 1))
+        self._apply_region(region, _TOUS_FERMES, _SANS_SUD, _SANS_EST)
 
-    def empty(self):
+    def empty(self, region=None):
         """
         Supprime tous les murs du labyrinthe.
+        Tous les passages sont ouverts d'un coup (une opération par ligne), sur toute la grille ou seulement entre
+        les cellules d'une région rectangulaire (les murs du tour de la région ne changent pas).
 
         Arguments :
-            Aucun
+            region (tuple) : (ligne, colonne, hauteur, largeur) de la région (None : tout le labyrinthe)
 
         Retour :
-            Aucun
+            Aucun (lève ValueError, sans rien modifier, si la région déborde du labyrinthe)
         """
-        for i in range(self.width):
-            for b in range(self.height - 1):
-                self.remove_wall((b, i), (b + 1, i))
-        for b in range(self.height):
-            for i in range(self.width - 1):
-                self.remove_wall((b, i), (b, i + 1))
+        self._apply_region(region, _TOUS_OUVERTS, _AVEC_SUD, _AVEC_EST)
 
     def get_contiguous_cells(self,c):
         """
@@ -200,14 +922,17 @@ class Maze:
             Cette liste peut être vide si la cellule n'a pas de voisins
         """
         liste_contigues=[]
-        if (c[0]+1,c[1]) in self.neighbors :
-            liste_contigues.append((c[0]+1,c[1]))
-        if (c[0]-1,c[1]) in self.neighbors :
-            liste_contigues.append((c[0]-1,c[1]))
-        if (c[0],c[1]+1) in self.neighbors :
-            liste_contigues.append((c[0],c[1]+1))
-        if (c[0],c[1]-1) in self.neighbors :
-            liste_contigues.append((c[0],c[1]-1))
+        i, j = c
+        if not (0 <= i < self.height and 0 <= j < self.width):
+            return liste_contigues
+        if i+1 < self.height :
+            liste_contigues.append((i+1,j))
+        if i > 0 :
+            liste_contigues.append((i-1,j))
+        if j+1 < self.width :
+            liste_contigues.append((i,j+1))
+        if j > 0 :
+            liste_contigues.append((i,j-1))
         return liste_contigues
 
     def get_reachable_cells(self,c) :
@@ -222,41 +947,60 @@ class Maze:
             liste_accessibles : Liste de tuples représentant les coordonnées des cellules accessibles
         """
         liste_accessibles=[]
-        voisines=self.get_contiguous_cells(c)
-        for i in range (len(voisines)):
-            if voisines[i] in self.neighbors[c]:
-                liste_accessibles.append(voisines[i])
+        i, j = c
+        if not (0 <= i < self.height and 0 <= j < self.width):
+            return liste_accessibles
+        cells = self._cells
+        k = i * self.width + j
+        if cells[k] & SUD :
+            liste_accessibles.append((i+1,j))
+        if i > 0 and cells[k-self.width] & SUD :
+            liste_accessibles.append((i-1,j))
+        if cells[k] & EST :
+            liste_accessibles.append((i,j+1))
+        if j > 0 and cells[k-1] & EST :
+            liste_accessibles.append((i,j-1))
         return liste_accessibles
 
     @classmethod
-    def gen_btree(self,h, w):
+    def gen_btree(self, h, w, rng=None, instrumentation=None):
         """
         Génère un labyrinthe à h lignes et w colonnes en utilisant l’algorithme de construction par arbre binaire.
 
         Explication de l'algorithme :
         On initie un labyrinthe plein. Ensuite, pour chaque cellule, on supprime aléatoirement le mur EST ou le mur SUD,
         attention s'il y a un seul mur, supprimer ce dernier, si aucun des deux : ne rien faire.
+        Les choix sont indépendants d'une cellule à l'autre : tous les bits aléatoires sont tirés d'un coup et
+        convertis en passages sur toute la grille sans boucle Python.
 
         Arguments :
             h (int) : nombre de ligne(s) du labyrinthe
             w (int) : nombre de colonne(s) du labyrinthe
+            rng (random.Random) : générateur aléatoire à utiliser (par défaut, celui du module random)
+            instrumentation (Instrumentation) : mesures facultatives (voir Instrumentation)
 
         Retour :
             labyrinthe : labyrinthe modifié par l'algorithme de construction par arbre binaire
         """
+        rng = random if rng is None else rng
+        debut = time.perf_counter()
         labyrinthe = Maze(h, w, empty = False)
-        for cell in labyrinthe.neighbors :  #Parcours toutes les cellules du labyrinthe
-            reachable = labyrinthe.get_reachable_cells(cell)    #Cellule autour (sauf si mur)
-            contiguous = labyrinthe.get_contiguous_cells(cell)  #Cellule autour (même si mur)
-            if (cell[0]+1,cell[1]) not in reachable and (cell[0]+1,cell[1]) in contiguous :
-                if (cell[0], cell[1] + 1) not in reachable and (cell[0], cell[1] + 1) in contiguous and randint(0,1)==1:
-                    labyrinthe.remove_wall(cell,(cell[0], cell[1] + 1))
-                else :
-                    labyrinthe.remove_wall(cell, (cell[0] + 1, cell[1]))
+        labyrinthe.algorithm = "btree"
+        if h * w == 0:
+            return labyrinthe
+        cells = labyrinthe._cells
+        n = (h - 1) * w  # cellules qui ont un mur SUD
+        if n:
+            # Un bit aléatoire par cellule, tirés d'un coup : 1 -> on casse le mur EST, 0 -> le mur SUD
+            bits = format(rng.getrandbits(n), f'0{n}b').encode('ascii')
+            cells[:n] = bits.translate(_BITS_VERS_EST_OU_SUD)
+            cells[w - 1:n:w] = bytes([SUD]) * (h - 1)  # dernière colonne : seul le mur SUD existe
+        cells[n:n + w - 1] = bytes([EST]) * (w - 1)  # dernière ligne : seul le mur EST existe
+        labyrinthe._report_generation(instrumentation, debut, tirages=1 if n else 0)
         return labyrinthe
 
     @classmethod
-    def gen_sidewinder(self, h, w):
+    def gen_sidewinder(self, h, w, rng=None, instrumentation=None):
         """
         Génère un labyrinthe à h lignes et w colonnes en utilisant l'algorithme de construction de labyrinthe
         nommé Sidewinder.
@@ -266,34 +1010,58 @@ class Maze:
         en choisissant aléatoirement de casser le mur EST d'une cellule. Pour chaque séquence de cellules voisines
         (connectées) créée sur la ligne, on casse un mur SUD au hasard d'une de ces cellules
         (une séquence peut être constituée d'une seule cellule).
+        Les murs EST d'une ligne sont tirés d'un coup et écrits directement dans le tableau des passages ;
+        seul le choix du mur SUD de chaque séquence demande un tirage.
 
         Arguments:
             h (int) : nombre de ligne(s) du labyrinthe
             w (int) : nombre de colonne(s) du labyrinthe
+            rng (random.Random) : générateur aléatoire à utiliser (par défaut, celui du module random)
+            instrumentation (Instrumentation) : mesures facultatives (voir Instrumentation)
 
         Retour:
             labyrinthe : labyrinthe modifié par l'algorithme de construction Sidewinder
         """
+        rng = random if rng is None else rng
+        debut = time.perf_counter()
         labyrinthe = Maze(h, w, empty=False)
+        labyrinthe.algorithm = "sidewinder"
+        if h * w == 0:
+            return labyrinthe
+        cells = labyrinthe._cells
         for i in range(h - 1):
-            seq = []
-            for j in range(w - 1):
-                seq.append((i, j))
-                if randint(0, 1) == 1: # Pile = 1 / Face = 0
-                    labyrinthe.remove_wall((i, j), (i, j + 1))
-                else:
-                    cell = seq[randint(0, len(seq)-1)]
-                    labyrinthe.remove_wall(cell, (cell[0] + 1, cell[1]))
-                    seq = []
-            seq.append((i, w - 1))
-            cell = seq[randint(0, len(seq)-1)]
-            labyrinthe.remove_wall(cell, (cell[0] + 1, cell[1]))
-        for j in range(w - 1):
-            labyrinthe.remove_wall((h - 1, j), (h - 1, j + 1))
+            cells[i * w:(i + 1) * w] = Maze._sidewinder_row(w, rng)
+        cells[(h - 1) * w:h * w - 1] = bytes([EST]) * (w - 1)  # dernière ligne : un seul couloir
+        if instrumentation is not None:
+            # un tirage pour les murs EST de chaque ligne, puis un par séquence (autant que de murs SUD cassés)
+            sequences = cells.count(SUD) + cells.count(EST | SUD)
+            labyrinthe._report_generation(instrumentation, debut, tirages=(h - 1) * (w > 1) + sequences)
         return labyrinthe
 
+    @staticmethod
+    def _sidewinder_row(w, rng):
+        """
+        Tire une ligne (autre que la dernière) de l'algorithme Sidewinder.
+
+        Arguments :
+            w (int) : nombre de colonne(s) du labyrinthe
+            rng (random.Random) : générateur aléatoire à utiliser
+
+        Retour :
+            bytearray de w octets : passages (bits EST et SUD) des cellules de la ligne
+        """
+        # Pile = 1 : on casse le mur EST / Face = 0 : la séquence se termine (toujours le cas en bout de ligne)
+        tirage = format(rng.getrandbits(w - 1), f'0{w - 1}b') + '0' if w > 1 else '0'
+        ligne = bytearray(tirage.encode('ascii').translate(_BITS_VERS_EST))
+        debut = 0
+        for sequence in tirage.split('0')[:-1]:  # pour chaque séquence, on casse le mur SUD d'une de ses cellules
+            longueur = len(sequence) + 1
+            ligne[debut + int(rng.random() * longueur)] |= SUD
+            debut += longueur
+        return ligne
+
     @classmethod
-    def gen_fusion(self,h,w):
+    def gen_fusion(self, h, w, rng=None, instrumentation=None):
         """
         Génère un labyrinthe à h lignes et w colonnes en utilisant l'algorithme de fusion de chemins.
 
@@ -305,33 +1073,44 @@ class Maze:
         un mécanisme de labélisation des cellules (avec des entiers). Lorsqu'on casse un mur depuis une cellule,
         le label de la cellule "se propage" dans la zone découverte. Mais on n'ouvrira un mur que lorsque le label de
         la cellule courante est différent du label de la cellule qui est de l'autre côté du mur.
+        Les labels sont gérés par une structure union-find (compression de chemin et union par rang),
+        ce qui rend la fusion de deux zones quasi constante au lieu de parcourir toutes les cellules.
 
         Arguments :
             h (int) : nombre de ligne(s) du labyrinthe
             w (int) : nombre de colonne(s) du labyrinthe
+            rng (random.Random) : générateur aléatoire à utiliser (par défaut, celui du module random)
+            instrumentation (Instrumentation) : mesures facultatives (voir Instrumentation)
 
         Retour :
             labyrinthe : labyrinthe modifié par l'algorithme de fusion de chemins
         """
+        rng = random if rng is None else rng
+        debut = time.perf_counter()
         labyrinthe = Maze(h, w, empty=False)
-        label={}
-        ind=0
-        for i in labyrinthe.neighbors : # Pour toutes les cellules du labyrinthe
-            ind+=1
-            label[i]=ind
-        mur=labyrinthe.get_walls()
-        random.shuffle(mur)
-        for i in range (len(mur)):
-            if label[mur[i][0]]!=label[mur[i][1]]:
-                labyrinthe.remove_wall(mur[i][0],mur[i][1])
-                labelCellule=label[mur[i][1]]
-                for valeur in label:
-                    if label[valeur] == labelCellule :
-                        label[valeur]=label[mur[i][0]]
+        labyrinthe.algorithm = "fusion"
+        ensembles = _UnionFind(h * w)  # chaque cellule a son propre label
+        cells = labyrinthe._cells
+        with _phase(instrumentation, "gen_fusion.shuffle"):
+            murs = labyrinthe._wall_ids()
+            rng.shuffle(murs)
+        rappel = instrumentation.callback if instrumentation is not None else None
+        with _phase(instrumentation, "gen_fusion.merge"):
+            for mur in murs:
+                k = mur >> 1
+                if mur & 1:
+                    bit, voisine = SUD, k + w
+                else:
+                    bit, voisine = EST, k + 1
+                if ensembles.union(k, voisine):  # labels différents : on casse le mur
+                    cells[k] |= bit
+                    if rappel is not None:
+                        rappel("passage", divmod(k, w), divmod(voisine, w))
+        labyrinthe._report_generation(instrumentation, debut, tirages=max(len(murs) - 1, 0))
         return labyrinthe
 
     @classmethod
-    def gen_exploration(self,h,w):
+    def gen_exploration(self, h, w, rng=None, instrumentation=None):
         """
         Génère un labyrinthe à h lignes et w colonnes en utilisant l'algorithme d'exploration exhaustive.
 
@@ -342,41 +1121,59 @@ class Maze:
         on la remet dans la pile. On choisit ensuite (au hasard) un de ces voisins (contigues).
         On va alors casser le mur entre la cellule (retirée de la pile) et son voisin choisi. Enfin, on marque la
         cellule voisine comme "visitée", puis on la remet dans la pile.
+        Les cellules visitées sont marquées dans un tableau d'octets et la pile est un tableau d'entiers
+        préalloué : une cellule n'est empilée qu'une seule fois, l'algorithme est donc linéaire.
 
         Arguments :
             h (int) : nombre de ligne(s) du labyrinthe
             w (int) : nombre de colonne(s) du labyrinthe
+            rng (random.Random) : générateur aléatoire à utiliser (par défaut, celui du module random)
+            instrumentation (Instrumentation) : mesures facultatives (voir Instrumentation)
 
         Retour :
             labyrinthe : labyrinthe modifié par l'algorithme d'exploration exhaustive
         """
+        rng = random if rng is None else rng
+        debut = time.perf_counter()
         labyrinthe = Maze(h, w, empty=False)
-        visite={}
-        for i in labyrinthe.neighbors:
-            # lettre N attribué aux cellules non visités et O pour les cellules visités
-            visite[i] = "N"
-        init=(randint(0,h-1),randint(0,w-1)) #On choisit une cellule au hasard
-        visite[init]="O"
-        pile=[init]
-        while pile!=[]: #Tant que la pile n'est pas vide
-            cell=pile.pop(-1) #.pop -> Enlève de la liste l'élément situé à la position indiquée et le renvoie en valeur de retour
-            voisins=labyrinthe.get_contiguous_cells(cell) # Voisins (même si mûr)
-            for i in range (len(voisins)):
-                if visite[voisins[0]]=="N": #Si voisin non visité
-                    voisins.append(voisins.pop(0))
-                    if cell not in pile: # Si cellule n'est pas dans la pile
-                        pile.append(cell)
-                else :
-                    voisins.pop(0)
-            if voisins!=[]: #Si voisins n'est pas vide
-                cellVoisine=voisins[randint(0,len(voisins)-1)]
-                labyrinthe.remove_wall(cell,cellVoisine)
-                visite[cellVoisine]="O"
-                pile.append(cellVoisine)
+        labyrinthe.algorithm = "exploration"
+        n = h * w
+        if n == 0:
+            return labyrinthe
+        visite = bytearray(n)       # 1 pour les cellules visitées
+        pile = array('l', [0]) * n  # chaque cellule n'est empilée qu'une fois : n places suffisent
+        init = rng.randrange(n)     # On choisit une cellule au hasard
+        visite[init] = 1
+        pile[0] = init
+        sommet = 1                  # nombre de cellules dans la pile
+        rappel = instrumentation.callback if instrumentation is not None else None
+        while sommet: # Tant que la pile n'est pas vide
+            cell = pile[sommet - 1]
+            i, j = divmod(cell, w)
+            voisins = []            # Voisins non visités (même si mûr)
+            if i + 1 < h and not visite[cell + w]:
+                voisins.append(cell + w)
+            if i > 0 and not visite[cell - w]:
+                voisins.append(cell - w)
+            if j + 1 < w and not visite[cell + 1]:
+                voisins.append(cell + 1)
+            if j > 0 and not visite[cell - 1]:
+                voisins.append(cell - 1)
+            if voisins: # La cellule reste dans la pile, on avance vers un voisin au hasard
+                cellVoisine = voisins[rng.randrange(len(voisins))]
+                labyrinthe._open_passage(cell, cellVoisine)
+                if rappel is not None:
+                    rappel("passage", divmod(cell, w), divmod(cellVoisine, w))
+                visite[cellVoisine] = 1
+                pile[sommet] = cellVoisine
+                sommet += 1
+            else: # Impasse : on dépile
+                sommet -= 1
+        labyrinthe._report_generation(instrumentation, debut, tirages=n)  # le départ, puis un tirage par cellule
         return labyrinthe
 
     @classmethod
-    def gen_wilson (self,h,w):
+    def gen_wilson(self, h, w, rng=None, instrumentation=None):
         """
         Génère un labyrinthe à h lignes et w colonnes en utilisant l'algorithme de Wilson.
 
@@ -387,202 +1184,1213 @@ class Maze:
         soit atteinte (en cas de boucle, si la tête du snake se mord la queue, « couper » la boucle formée
         [autrement dit, supprimer toutes étapes depuis le précédent passage]). Enfin, on marque chaque cellule du chemin
         et casser tous les murs rencontrés, jusqu’à la cellule marquée.
+        Les cellules marquées sont stockées dans un tableau d'octets, les cellules non marquées dans un tableau
+        dont on retire les éléments par échange avec le dernier, et la position de chaque cellule dans le parcours
+        courant est mémorisée : chaque étape de la marche (y compris la coupure d'une boucle) se fait en temps
+        constant amorti.
 
         Arguments :
             h (int) : nombre de ligne(s) du labyrinthe
             w (int) : nombre de colonne(s) du labyrinthe
+            rng (random.Random) : générateur aléatoire à utiliser (par défaut, celui du module random)
+            instrumentation (Instrumentation) : mesures facultatives (voir Instrumentation)
 
         Retour :
             labyrinthe : labyrinthe modifié par l'algorithme de Wilson
         """
+        rng = random if rng is None else rng
+        debut = time.perf_counter()
         labyrinthe = Maze(h, w, empty=False)
-        visite = []
-        for i in labyrinthe.neighbors: # Pour toutes les cellules du labyrinthe
-            visite.append(i)
-        visite.pop(randint(0, len(visite) - 1))
-        cell = visite[randint(0,len(visite)-1)]
-        parcours = [cell]
-        cellPrece=cell
-        while visite!=[]:
-            voisins = labyrinthe.get_contiguous_cells(cell)
-            if cellPrece!=cell :
-                voisins.remove(cellPrece)
-            cellPrece=cell
-            cell=voisins[randint(0,len(voisins)-1)]
-            if cell in parcours :
-                parcours = [cell]
-            elif cell not in visite:
-                for i in range (len(parcours)-1):
-                    labyrinthe.remove_wall(parcours[i],parcours[i+1])
-                    visite.remove(parcours[i])
-                labyrinthe.remove_wall(cell, parcours[-1])
-                visite.remove(parcours[-1])
-                if visite!=[]:
-                    cell = visite[randint(0, len(visite) - 1)]
-                    parcours = [cell]
-                    cellPrece=cell
-            else :
-                parcours.append(cell)
+        labyrinthe.algorithm = "wilson"
+        if h * w == 0:
+            return labyrinthe
+        # On travaille sur une grille bordée d'une rangée de cellules sentinelles :
+        # une cellule k (l, c) de la grille bordée a pour identifiant (l + 1) * W + (c + 1)
+        W = w + 2
+        etat = bytearray([2]) * ((h + 2) * W)  # 0 : non marquée, 1 : marquée (dans l'arbre), 2 : bordure
+        for i in range(1, h + 1):
+            etat[i * W + 1:i * W + 1 + w] = bytes(w)
+        reste = array('l', [i * W + j for i in range(1, h + 1) for j in range(1, w + 1)])  # cellules non marquées
+        place = array('l', [0]) * len(etat)     # place[k] : indice de la cellule k dans 'reste'
+        for indice, k in enumerate(reste):
+            place[k] = indice
+        position = array('l', [-1]) * len(etat)  # position[k] : indice de la cellule k dans le parcours courant
+        directions = (W, -W, 1, -1)
+
+        def marquer(k):
+            # retrait de k des cellules non marquées, par échange avec la dernière
+            etat[k] = 1
+            derniere = reste.pop()
+            if derniere != k:
+                reste[place[k]] = derniere
+                place[derniere] = place[k]
 
+        def identifiant(k):
+            return (k // W - 1) * w + k % W - 1
+
+        rappel = instrumentation.callback if instrumentation is not None else None
+        mesure = instrumentation is not None
+        duree_marches = duree_cassage = 0.0
+        pas = 0           # nombre de tirages de la marche (y compris ceux qui sortent de la grille)
+        marches = 0
+        coupures = 0
+        plus_longue = 0
+
+        marquer(reste[rng.randrange(len(reste))])
+        while reste:
+            cell = reste[rng.randrange(len(reste))]
+            if mesure:
+                instant = time.perf_counter()
+            marches += 1
+            pas_debut = pas
+            parcours = [cell]
+            position[cell] = 0
+            e = 0
+            while e != 1:  # Marche aléatoire jusqu'à une cellule marquée
+                pas += 1
+                suivante = cell + directions[int(rng.random() * 4)]
+                e = etat[suivante]
+                if e == 2:
+                    continue
+                cell = suivante
+                if rappel is not None:
+                    rappel("walk", divmod(identifiant(cell), w))
+                p = position[cell]
+                if p >= 0:  # Le snake se mord la queue : on coupe la boucle
+                    coupures += 1
+                    for boucle in parcours[p + 1:]:
+                        position[boucle] = -1
+                    del parcours[p + 1:]
+                else:
+                    position[cell] = len(parcours)
+                    parcours.append(cell)
+            plus_longue = max(plus_longue, pas - pas_debut)
+            if mesure:
+                fin_marche = time.perf_counter()
+                duree_marches += fin_marche - instant
+            # On marque le parcours et on casse les murs rencontrés jusqu'à la cellule marquée
+            for a in range(len(parcours) - 1):
+                labyrinthe._open_passage(identifiant(parcours[a]), identifiant(parcours[a + 1]))
+                if rappel is not None:
+                    rappel("passage", divmod(identifiant(parcours[a]), w), divmod(identifiant(parcours[a + 1]), w))
+                marquer(parcours[a])
+                position[parcours[a]] = -1
+            position[cell] = -1
+            if mesure:
+                duree_cassage += time.perf_counter() - fin_marche
+
+        if mesure:
+            instrumentation.add_time("gen_wilson.walk", duree_marches)
+            instrumentation.add_time("gen_wilson.carve", duree_cassage)
+        labyrinthe._report_generation(instrumentation, debut, tirages=1 + marches + pas, walk_steps=pas,
+                                      walks=marches, loop_erasures=coupures, longest_walk=plus_longue)
         return labyrinthe
 
-    def overlay(self, content=None):
+    @classmethod
+    def gen_eller(self, h, w, rng=None, instrumentation=None):
         """
-        Rendu en mode texte, sur la sortie standard, \
-        d'un labyrinthe avec du contenu dans les cellules
-        Argument:
-            content (dict) : dictionnaire tq content[cell] contient le caractère à afficher au milieu de la cellule
-        Retour:
-            string
+        Génère un labyrinthe à h lignes et w colonnes en utilisant l'algorithme d'Eller (voir stream_eller).
+
+        Arguments :
+            h (int) : nombre de ligne(s) du labyrinthe
+            w (int) : nombre de colonne(s) du labyrinthe
+            rng (random.Random) : générateur aléatoire à utiliser (par défaut, celui du module random)
+            instrumentation (Instrumentation) : mesures facultatives (voir Instrumentation)
+
+        Retour :
+            labyrinthe : labyrinthe modifié par l'algorithme d'Eller
         """
-        if content is None:
-            content = {(i, j): ' ' for i in range(self.height) for j in range(self.width)}
-        else:
-            # Python >=3.9
-            # content = content | {(i, j): ' ' for i in range(
-            #    self.height) for j in range(self.width) if (i,j) not in content}
-            # Python <3.9
-            new_content = {(i, j): ' ' for i in range(self.height) for j in range(self.width) if (i, j) not in content}
-            content = {**content, **new_content}
-        txt = r""
-        # Première ligne
-        txt += "┏"
-        for j in range(self.width - 1):
-            txt += "━━━┳"
-        txt += "━━━┓\n"
-        txt += "┃"
-        for j in range(self.width - 1):
-            txt += " " + content[(0, j)] + " ┃" if (0, j + 1) not in self.neighbors[(0, j)] else " " + content[
-                (0, j)] + "  "
-        txt += " " + content[(0, self.width - 1)] + " ┃\n"
-        # Lignes normales
-        for i in range(self.height - 1):
-            txt += "┣"
-            for j in range(self.width - 1):
-                txt += "━━━╋" if (i + 1, j) not in self.neighbors[(i, j)] else "   ╋"
-            txt += "━━━┫\n" if (i + 1, self.width - 1) not in self.neighbors[(i, self.width - 1)] else "   ┫\n"
-            txt += "┃"
-            for j in range(self.width):
-                txt += " " + content[(i + 1, j)] + " ┃" if (i + 1, j + 1) not in self.neighbors[(i + 1, j)] else " " + \
-                                                                                                                 content[
-                                                                                                                     (
-                                                                                                                     i + 1,
-                                                                                                                     j)] + "  "
-            txt += "\n"
-        # Bas du tableau
-        txt += "┗"
-        for i in range(self.width - 1):
-            txt += "━━━┻"
-        txt += "━━━┛\n"
-        return txt
+        rng = random if rng is None else rng
+        debut = time.perf_counter()
+        labyrinthe = Maze(h, w, empty=False)
+        labyrinthe.algorithm = "eller"
+        if instrumentation is not None:
+            rng = _CountedRandom(rng)
+        for i, ligne in enumerate(Maze.stream_eller(h, w, rng)):
+            labyrinthe._cells[i * w:(i + 1) * w] = ligne
+        labyrinthe._report_generation(instrumentation, debut,
+                                      tirages=rng.tirages if instrumentation is not None else None)
+        return labyrinthe
 
-    def solve_dfs(self, start, stop):
+    @classmethod
+    def stream_eller(self, h, w, rng=None):
         """
-        Calcule le parcours le plus court afin d'atteindre la cellule stop à partir de la cellule start.
+        Génère un labyrinthe parfait à h lignes et w colonnes ligne par ligne, avec l'algorithme d'Eller, en n'utilisant
+        qu'une mémoire proportionnelle à w : h peut donc être gigantesque.
 
         Explication de l'algorithme :
-        On utilise ici un parcours en profondeur du labyrinthe. Dans l'initialisation, on choisit la cellule de départ D
-        que l'on place dans une pile et que l'on marque. Ensuite on mémorise l'élément prédécesseur de D comme étant D.
-        Tant qu'il reste des cellules non marquées : on prend la première cellule (c) de la pile. Si c correspond à
-        la cellule A (ou arrivée), on met fin à l'algorithme. Sinon : pour chaque voisine de c, on vérifie si elle
-        n'est pas marquée pour l'ajouter dans la pile et enfin mémoriser son prédecesseur comme étant c.
+        Chaque cellule de la ligne courante porte le label de son ensemble (les cellules reliées par les lignes déjà
+        produites). On casse au hasard des murs EST entre cellules de labels différents (en fusionnant les ensembles),
+        puis on casse au moins un mur SUD par ensemble pour qu'il se prolonge dans la ligne suivante ; les cellules de
+        la ligne suivante qui ne sont pas reliées par le haut reçoivent un nouveau label. Sur la dernière ligne, on
+        casse tous les murs EST entre labels différents.
 
         Arguments :
-            start (tuple): La cellule de départ
-            stop (tuple): La cellule d'arrivée
+            h (int) : nombre de ligne(s) du labyrinthe
+            w (int) : nombre de colonne(s) du labyrinthe
+            rng (random.Random) : générateur aléatoire à utiliser (par défaut, celui du module random)
+
         Retour :
-            Nombre minimal de déplacements nécessaires pour aller de start à stop
-        """
-        parcours=[]
-        marque=[start]
-        predecesseurs={start:start}
-        while marque!=[] :
-            cell=marque.pop(-1)
-            if cell==stop:
-                marque=[]
-            else :
-                temp=self.get_reachable_cells(cell)
-                for i in range (len(temp)):
-                    if temp[i] not in marque and temp[i]!=predecesseurs[cell]:
-                        marque.append(temp[i])
-                        predecesseurs[temp[i]]=cell
-        cell = stop
-        while cell != start:
-            parcours.append(cell)
-            cell=predecesseurs[cell]
-        return parcours
+            générateur de h lignes (bytes de w octets, bits EST et SUD de chaque cellule, comme dans '_cells')
+        """
+        rng = random if rng is None else rng
+        if h * w == 0:
+            return
+        ensemble = list(range(w))  # label de chaque cellule de la ligne courante (labels compris entre 0 et w-1)
+        for i in range(h):
+            derniere = i == h - 1
+            parent = list(range(w))  # union-find sur les labels de la ligne
 
-    def solve_bfs (self, start, stop):
+            def find(x):
+                while parent[x] != x:
+                    parent[x] = parent[parent[x]]
+                    x = parent[x]
+                return x
+
+            ligne = bytearray(w)
+            tirage = '1' * (w - 1) if derniere else format(rng.getrandbits(w - 1), f'0{w - 1}b') if w > 1 else ''
+            for j in range(w - 1):
+                if tirage[j] == '1':
+                    a = find(ensemble[j])
+                    b = find(ensemble[j + 1])
+                    if a != b:
+                        parent[b] = a
+                        ligne[j] |= EST
+            if not derniere:
+                groupes = {}
+                for j in range(w):
+                    groupes.setdefault(find(ensemble[j]), []).append(j)
+                suivant = [-1] * w
+                prochain = 0  # prochain label libre
+                for membres in groupes.values():
+                    garanti = membres[int(rng.random() * len(membres))]
+                    for j in membres:
+                        if j == garanti or rng.random() < 0.5:
+                            ligne[j] |= SUD
+                            suivant[j] = prochain
+                    prochain += 1
+                for j in range(w):
+                    if suivant[j] < 0:
+                        suivant[j] = prochain
+                        prochain += 1
+                ensemble = suivant
+            yield bytes(ligne)
+
+    @classmethod
+    def stream_sidewinder(self, h, w, rng=None):
         """
-        Calcule le parcours le plus court afin d'atteindre la cellule stop à partir de la cellule start. Ici, on utilise
-        un parcours en largeur, ce qui signifie que l'algorithme va trouver différents chemins mais on gardera le plus
-        cours d'entre eux
+        Génère un labyrinthe à h lignes et w colonnes ligne par ligne avec l'algorithme Sidewinder (voir
+        gen_sidewinder). Chaque ligne ne dépend d'aucune autre : la mémoire utilisée est proportionnelle à w.
 
         Arguments :
-             start (tuple) : La cellule de départ
-             stop (tuple) : La cellule d'arrivée
-        Retour :
-             Nombre minimal de déplacements nécessaires pour aller de start à stop
-        """
+            h (int) : nombre de ligne(s) du labyrinthe
+            w (int) : nombre de colonne(s) du labyrinthe
+            rng (random.Random) : générateur aléatoire à utiliser (par défaut, celui du module random)
+
+        Retour :
+            générateur de h lignes (bytes de w octets, bits EST et SUD de chaque cellule, comme dans '_cells')
+        """
+        rng = random if rng is None else rng
+        if h * w == 0:
+            return
+        for i in range(h - 1):
+            yield bytes(Maze._sidewinder_row(w, rng))
+        yield bytes([EST]) * (w - 1) + bytes(1)
+
+    def _rows(self):
+        """
+        Retourne un générateur des lignes du labyrinthe (bytes de width octets, bits EST et SUD de chaque cellule).
+        """
+        w = self.width
+        for i in range(self.height):
+            yield bytes(self._cells[i * w:(i + 1) * w])
+
+    @staticmethod
+    def _text_lines(rows, width, content=None):
+        """
+        Produit, ligne par ligne, la représentation textuelle (celle de __str__, ou d'overlay si content est donné)
+        d'un labyrinthe donné par ses lignes. Chaque ligne de texte est assemblée à partir de motifs
+        précalculés : chaque octet de la ligne est traduit en une lettre (bytes.translate) puis chaque lettre est
+        remplacée par son motif ; seules les lignes qui contiennent des cellules annotées sont assemblées cellule par
+        cellule.
+
+        Arguments :
+            rows (itérable) : lignes du labyrinthe (bytes de width octets, bits EST et SUD de chaque cellule)
+            width (int) : nombre de colonne(s) du labyrinthe
+            content (dict) : dictionnaire tq content[cell] contient le caractère à afficher au milieu de la cellule
+
+        Retour :
+            générateur de chaînes de caractères (chacune terminée par un retour à la ligne)
+        """
+        case = ("   ┃", "    ")                  # indice : bit EST de la cellule
+        separation_fin = ("━━━┫\n", "   ┫\n")     # indice : bit SUD de la cellule
+        contenu_par_ligne = {}                   # ligne -> [(colonne, caractère)], seulement pour les cellules annotées
+        for (i, j), caractere in (content or {}).items():
+            if 0 <= j < width:  # les cellules hors de la grille sont ignorées
+                contenu_par_ligne.setdefault(i, []).append((j, caractere))
+        yield "┏" + "━━━┳" * (width - 1) + "━━━┓\n"
+        rows = iter(rows)
+        ligne = next(rows, None)
+        i = 0
+        while ligne is not None:
+            ligne = bytes(ligne)
+            if i in contenu_par_ligne:
+                morceaux = [case[c & EST] for c in ligne]
+                for j, caractere in contenu_par_ligne[i]:
+                    morceaux[j] = " " + caractere + ("  " if ligne[j] & EST else " ┃")
+                yield "┃" + "".join(morceaux) + "\n"
+            else:
+                yield "┃" + ligne.translate(_MOTIF_CASES).decode("ascii").replace("a", "   ┃").replace("b", "    ") + "\n"
+            suivante = next(rows, None)
+            if suivante is not None:
+                separation = ligne[:-1].translate(_MOTIF_SEPARATIONS).decode("ascii")
+                yield "┣" + separation.replace("c", "━━━╋").replace("d", "   ╋") + separation_fin[ligne[-1] >> 1 & 1]
+            ligne = suivante
+            i += 1
+        yield "┗" + "━━━┻" * (width - 1) + "━━━┛\n"
+
+    @staticmethod
+    def write_text(rows, width, stream, content=None):
+        """
+        Écrit la représentation textuelle d'un labyrinthe donné par ses lignes (par exemple celles produites par
+        stream_eller ou stream_sidewinder) dans un flux texte, au fur et à mesure.
+
+        Arguments :
+            rows (itérable) : lignes du labyrinthe (bytes de width octets)
+            width (int) : nombre de colonne(s) du labyrinthe
+            stream : flux texte ouvert en écriture (fichier, sys.stdout...)
+            content (dict) : dictionnaire tq content[cell] contient le caractère à afficher au milieu de la cellule
+
+        Retour :
+            Rien
+        """
+        for texte in Maze._text_lines(rows, width, content):
+            stream.write(texte)
+
+    @staticmethod
+    def write_rows(rows, stream):
+        """
+        Écrit les lignes d'un labyrinthe dans un flux binaire, au fur et à mesure (un octet par cellule, bits EST et
+        SUD, dans l'ordre des lignes).
+
+        Arguments :
+            rows (itérable) : lignes du labyrinthe (bytes de width octets)
+            stream : flux binaire ouvert en écriture
+
+        Retour :
+            nombre de lignes écrites
+        """
+        nombre = 0
+        for ligne in rows:
+            stream.write(ligne)
+            nombre += 1
+        return nombre
+
+    def save(self, path):
+        """
+        Enregistre le labyrinthe dans un fichier binaire (voir load) : un en-tête (version du format, dimensions,
+        algorithme de génération, graine) suivi des passages, un octet par cellule (bits EST et SUD).
+
+        Argument :
+            path (str) : chemin du fichier à écrire
+
+        Retour :
+            Rien
+        """
+        Maze.save_rows(path, self.height, self.width, self._rows(), self.algorithm, self.seed)
+
+    @staticmethod
+    def save_rows(path, height, width, rows, algorithm=None, seed=None):
+        """
+        Écrit au format binaire de save un labyrinthe donné ligne par ligne (par exemple par stream_eller),
+        sans jamais le construire en mémoire.
+
+        Arguments :
+            path (str) : chemin du fichier à écrire
+            height (int) : nombre de ligne(s) du labyrinthe
+            width (int) : nombre de colonne(s) du labyrinthe
+            rows (itérable) : lignes du labyrinthe (bytes de width octets)
+            algorithm (str) : nom de l'algorithme de génération (facultatif)
+            seed (int) : graine de la génération (facultative)
+
+        Retour :
+            Rien
+        """
+        nom = (algorithm or "").encode("utf-8")
+        if seed is not None and not -2 ** 63 <= seed < 2 ** 63:
+            raise ValueError(f"graine {seed} : le format n'enregistre que des graines sur 64 bits signés")
+        if not (0 <= height < 2 ** 64 and 0 <= width < 2 ** 64):
+            raise ValueError(f"dimensions {height} x {width} non prises en charge par le format")
+        if len(nom) >= 2 ** 16:
+            raise ValueError("nom d'algorithme trop long pour le format")
+        entete = _ENTETE.pack(_MAGIC, _FORMAT_VERSION, 0 if seed is None else 1, height, width,
+                              0 if seed is None else seed, len(nom))
+        with open(path, "wb") as fichier:
+            fichier.write(entete + nom)
+            nombre = Maze.write_rows(rows, fichier)
+        assert nombre == height, f"Erreur lors de l'écriture de {path} : {nombre} ligne(s) au lieu de {height}"
+
+    @classmethod
+    def load(self, path, memory_map=True):
+        """
+        Charge un labyrinthe enregistré avec save (ou save_rows).
+        Par défaut, le fichier est projeté en mémoire (mmap) : l'ouverture est immédiate quelle que soit la taille du
+        labyrinthe, et les cellules ne sont lues sur le disque qu'au moment où on y accède. Les modifications
+        (add_wall...) restent en mémoire et ne sont pas écrites dans le fichier.
+
+        Arguments :
+            path (str) : chemin du fichier à lire
+            memory_map (bool) : True pour projeter le fichier en mémoire, False pour le lire entièrement
+
+        Retour :
+            labyrinthe : le labyrinthe chargé
+        """
+        with open(path, "rb") as fichier:
+            entete = fichier.read(_ENTETE.size)
+            if len(entete) != _ENTETE.size:
+                raise ValueError(f"{path} est tronqué : en-tête de {len(entete)} octet(s) au lieu de {_ENTETE.size}")
+            magic, version, drapeaux, height, width, seed, taille_nom = _ENTETE.unpack(entete)
+            if magic != _MAGIC:
+                raise ValueError(f"{path} n'est pas un fichier de labyrinthe")
+            if version != _FORMAT_VERSION:
+                raise ValueError(f"{path} : version de format {version} non prise en charge")
+            nom = fichier.read(taille_nom)
+            if len(nom) != taille_nom:
+                raise ValueError(f"{path} est tronqué : nom d'algorithme incomplet")
+            algorithm = nom.decode("utf-8") or None
+            debut = _ENTETE.size + taille_nom
+            n = height * width
+            if memory_map and n > 0:
+                projection = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_COPY)
+                cells = memoryview(projection)[debut:debut + n]
+            else:
+                projection = None
+                cells = bytearray(fichier.read(n))
+        if len(cells) != n:
+            raise ValueError(f"{path} est tronqué : {len(cells)} cellule(s) au lieu de {n}")
+        labyrinthe = Maze._from_cells(height, width, cells)
+        labyrinthe._mmap = projection  # la projection doit vivre aussi longtemps que le labyrinthe
+        labyrinthe.algorithm = algorithm
+        labyrinthe.seed = seed if drapeaux & 1 else None
+        return labyrinthe
+
+    def share(self, name=None):
+        """
+        Publie les passages du labyrinthe dans un segment de mémoire partagée, que d'autres processus ouvrent sans
+        copie avec Maze.attach(nom). Le segment contient l'en-tête (hauteur, largeur), puis un octet par cellule ;
+        c'est une copie : les modifications ultérieures du labyrinthe n'y sont pas reportées.
+
+        Argument :
+            name (str) : nom du segment (None : nom choisi par le système)
+
+        Retour :
+            shared_memory.SharedMemory : le segment (son nom est dans l'attribut name) ; le processus qui l'a créé
+            doit le libérer avec close() puis unlink() quand plus personne ne s'en sert (avant Python 3.13, si des
+            processus qui partagent son resource_tracker s'y sont attachés, utiliser plutôt Maze.unshare)
+        """
+        n = self.height * self.width
+        segment = shared_memory.SharedMemory(name=name, create=True, size=_ENTETE_PARTAGE.size + n)
+        _ENTETE_PARTAGE.pack_into(segment.buf, 0, self.height, self.width)
+        segment.buf[_ENTETE_PARTAGE.size:_ENTETE_PARTAGE.size + n] = self._cells
+        return segment
+
+    @staticmethod
+    def unshare(segment):
+        """
+        Libère un segment créé par share (close puis unlink). Avant Python 3.13, attach retire le segment du suivi
+        du resource_tracker ; un processus attaché qui partage le resource_tracker du créateur (processus d'un
+        ProcessPoolExecutor, ou le créateur lui-même) l'en retire donc aussi pour le créateur : on l'y remet avant
+        unlink, qui l'en retire. Le resource_tracker n'existe que sur les systèmes POSIX : ailleurs (Windows),
+        unshare se contente de close puis unlink.
+
+        Argument :
+            segment (shared_memory.SharedMemory) : résultat de share
+
+        Retour :
+            Rien
+        """
+        if os.name == "posix":  # comme shared_memory, qui n'utilise le resource_tracker que sous POSIX
+            resource_tracker.register(segment._name, "shared_memory")
+        segment.close()
+        segment.unlink()
+
+    @classmethod
+    def attach(self, name):
+        """
+        Ouvre en lecture seule un labyrinthe publié avec share, sans copier ses passages : N processus qui
+        s'attachent au même segment partagent une seule grille. Les méthodes de lecture (get_reachable_cells,
+        solve_*, distance_geo, rendu...) travaillent directement sur le segment ; add_wall et remove_wall lèvent
+        TypeError.
+        Exemple avec un ProcessPoolExecutor : initializer=... qui appelle Maze.attach(segment.name) une fois par
+        processus et garde le labyrinthe dans une variable globale.
+
+        Argument :
+            name (str) : nom du segment (attribut name du résultat de share)
+
+        Retour :
+            labyrinthe en lecture seule
+        """
+        try:
+            segment = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # avant Python 3.13, sous POSIX, tout segment ouvert est confié au resource_tracker, qui le détruirait à
+            # la fin d'un processus indépendant : on retire le segment de son suivi
+            segment = shared_memory.SharedMemory(name=name)
+            if os.name == "posix":
+                resource_tracker.unregister(segment._name, "shared_memory")
+        height, width = _ENTETE_PARTAGE.unpack_from(segment.buf, 0)
+        debut = _ENTETE_PARTAGE.size
+        cells = segment.buf[debut:debut + height * width].toreadonly()
+        labyrinthe = Maze._from_cells(height, width, cells)
+        labyrinthe._shared = segment  # le segment doit rester ouvert aussi longtemps que le labyrinthe
+        return labyrinthe
+
+    @classmethod
+    def generate_many(self, algorithm, h, w, count, seed=None, workers=None, directory=None):
+        """
+        Génère une série de labyrinthes, éventuellement en parallèle sur plusieurs processus.
+        Chaque labyrinthe utilise son propre générateur aléatoire, dont la graine est dérivée de seed et de son numéro
+        dans la série : le résultat ne dépend donc pas du nombre de processus utilisés.
+
+        Arguments :
+            algorithm (str) : nom de l'algorithme ('btree', 'sidewinder', 'fusion', 'exploration', 'wilson', 'eller')
+            h (int) : nombre de ligne(s) des labyrinthes
+            w (int) : nombre de colonne(s) des labyrinthes
+            count (int) : nombre de labyrinthes à générer
+            seed (int) : graine de la série (par défaut, tirée au hasard)
+            workers (int) : nombre de processus (par défaut ou si 1, la génération se fait dans le processus courant)
+            directory (str) : si donné, chaque labyrinthe est enregistré dans ce répertoire (voir save) par le
+                              processus qui l'a généré, au lieu d'être renvoyé
+
+        Retour :
+            liste des labyrinthes générés (ou des chemins des fichiers écrits si directory est donné),
+            dans l'ordre de la série ; l'attribut 'seed' de chaque labyrinthe contient sa graine
+        """
+        if not hasattr(Maze, "gen_" + algorithm):
+            raise ValueError(f"algorithme de génération inconnu : {algorithm}")
+        if seed is None:
+            seed = random.getrandbits(63)
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        taches = [(algorithm, h, w, _derived_seed(seed, numero), directory, numero) for numero in range(count)]
+        if workers is None or workers <= 1:
+            return [_generate_one(tache) for tache in taches]
+        with ProcessPoolExecutor(max_workers=workers) as executeur:
+            return list(executeur.map(_generate_one, taches, chunksize=max(1, count // (4 * workers))))
+
+    def overlay(self, content=None):
+        """
+        Rendu en mode texte, sur la sortie standard, \
+        d'un labyrinthe avec du contenu dans les cellules
+        Argument:
+            content (dict) : dictionnaire tq content[cell] contient le caractère à afficher au milieu de la cellule
+        Retour:
+            string
+        """
+        return "".join(Maze._text_lines(self._rows(), self.width, content))
+
+    def render(self, stream, content=None):
+        """
+        Écrit la représentation textuelle du labyrinthe (celle de __str__, ou d'overlay si content est donné) dans un
+        flux texte, ligne par ligne : le texte complet n'est jamais construit en mémoire.
+
+        Arguments :
+            stream : flux texte ouvert en écriture (fichier, sys.stdout...)
+            content (dict) : dictionnaire tq content[cell] contient le caractère à afficher au milieu de la cellule
+                             (seules les cellules présentes sont annotées)
+
+        Retour :
+            Rien
+        """
+        Maze.write_text(self._rows(), self.width, stream, content)
+
+    def _image_rows(self, solution=None):
+        """
+        Produit les lignes de blocs de l'image du labyrinthe : une grille de (2 * height + 1) x (2 * width + 1) blocs,
+        un bloc par cellule, par mur (ou passage) et par coin. Chaque bloc vaut _BLOC_MUR, _BLOC_SOL ou _BLOC_CHEMIN.
+
+        Argument :
+            solution (list) : cellules à colorer (par exemple le résultat de solve_bfs) ; les passages entre deux
+                              cellules consécutives de la liste sont aussi colorés
+
+        Retour :
+            générateur de 2 * height + 1 bytearray de 2 * width + 1 blocs
+        """
+        w = self.width
+        largeur = 2 * w + 1
+        chemin = {}  # indice de la ligne de blocs -> indices des blocs du chemin
+        if solution:
+            for n, (i, j) in enumerate(solution):
+                chemin.setdefault(2 * i + 1, []).append(2 * j + 1)
+                if n + 1 < len(solution):
+                    i2, j2 = solution[n + 1]
+                    if i == i2 and abs(j - j2) == 1:
+                        chemin.setdefault(2 * i + 1, []).append(j + j2 + 1)
+                    elif j == j2 and abs(i - i2) == 1:
+                        chemin.setdefault(i + i2 + 1, []).append(2 * j + 1)
+        yield bytearray(largeur)  # bordure du haut
+        for i, ligne in enumerate(self._rows()):
+            for indice, (conversion, impairs) in ((2 * i + 1, (_BLOCS_EST, True)), (2 * i + 2, (_BLOCS_SUD, False))):
+                blocs = bytearray(largeur)
+                if impairs:  # ligne des cellules : cellule, puis mur/passage EST
+                    blocs[1::2] = bytes([_BLOC_SOL]) * w
+                    blocs[2::2] = ligne.translate(conversion)
+                else:        # ligne des murs SUD : mur/passage SUD, puis coin
+                    blocs[1::2] = ligne.translate(conversion)
+                for b in chemin.get(indice, ()):
+                    blocs[b] = _BLOC_CHEMIN
+                yield blocs
+
+    def export_image(self, filename, scale=4, solution=None, fmt=None):
+        """
+        Exporte le labyrinthe sous forme d'image, sans bibliothèque extérieure : PGM (niveaux de gris), PPM (couleur)
+        ou PNG (compressé avec zlib, en couleur si une solution est donnée). Chaque cellule, chaque mur et chaque coin
+        occupe un carré de scale x scale pixels ; les murs sont noirs, les cellules blanches et la solution éventuelle
+        en rouge (en gris pour le PGM). L'image est écrite ligne par ligne : la mémoire utilisée ne dépend que de la
+        largeur du labyrinthe.
+
+        Arguments :
+            filename (str) : chemin du fichier à écrire
+            scale (int) : côté, en pixels, du carré associé à une cellule ou à un mur
+            solution (list) : cellules du chemin à colorer (par exemple le résultat de solve_bfs ; ajouter la cellule
+                              de départ à la liste pour la colorer aussi)
+            fmt (str) : 'pgm', 'ppm' ou 'png' (par défaut, déduit de l'extension de filename)
+
+        Retour :
+            Rien
+        """
+        fmt = (fmt or filename.rsplit(".", 1)[-1]).lower()
+        if fmt not in ("pgm", "ppm", "png"):
+            raise ValueError(f"Format d'image non pris en charge : {fmt}")
+        couleurs = _COULEURS_RVB if fmt == "ppm" or (fmt == "png" and solution) else _COULEURS_GRIS
+        canaux = len(couleurs)
+        largeur = (2 * self.width + 1) * scale
+        hauteur = (2 * self.height + 1) * scale
+
+        def lignes_pixels():
+            pixels = bytearray(largeur * canaux)
+            for blocs in self._image_rows(solution):
+                for canal, couleur in enumerate(couleurs):
+                    valeurs = blocs.translate(couleur)
+                    for k in range(scale):  # chaque bloc est répété scale fois en largeur
+                        pixels[k * canaux + canal::scale * canaux] = valeurs
+                for k in range(scale):      # et scale fois en hauteur
+                    yield pixels
+
+        with open(filename, "wb") as fichier:
+            if fmt != "png":
+                fichier.write(b"P%d\n%d %d\n255\n" % (6 if canaux == 3 else 5, largeur, hauteur))
+                for pixels in lignes_pixels():
+                    fichier.write(pixels)
+                return
+
+            def bloc_png(type_bloc, donnees):
+                fichier.write(struct.pack(">I", len(donnees)) + type_bloc + donnees)
+                fichier.write(struct.pack(">I", zlib.crc32(donnees, zlib.crc32(type_bloc))))
+
+            fichier.write(b"\x89PNG\r\n\x1a\n")
+            bloc_png(b"IHDR", struct.pack(">IIBBBBB", largeur, hauteur, 8, 2 if canaux == 3 else 0, 0, 0, 0))
+            compresseur = zlib.compressobj(1)  # compression rapide : les images de labyrinthes se compressent bien
+            for pixels in lignes_pixels():
+                donnees = compresseur.compress(b"\x00" + pixels)  # filtre 0 (aucun) sur chaque ligne
+                if donnees:
+                    bloc_png(b"IDAT", donnees)
+            bloc_png(b"IDAT", compresseur.flush())
+            bloc_png(b"IEND", b"")
+
+    def _search(self, start, stop, largeur):
+        """
+        Moteur de recherche commun aux méthodes solve_*.
+        La frontière est une deque (file pour un parcours en largeur, pile pour un parcours en profondeur),
+        les prédécesseurs sont stockés dans un tableau indexé par identifiant de cellule (-1 : non marquée)
+        et la recherche s'arrête dès que la cellule stop est atteinte.
+        Si l'index d'arbre est construit (voir build_tree_index), le chemin est directement extrait de l'arbre.
+
+        Arguments :
+            start (tuple) : La cellule de départ
+            stop (tuple) : La cellule d'arrivée
+            largeur (bool) : True pour un parcours en largeur, False pour un parcours en profondeur
+
+        Retour :
+            Liste des cellules du chemin, de stop jusqu'à la cellule qui suit start (vide si start == stop),
+            ou None si stop n'est pas accessible depuis start
+        """
+        w = self.width
+        cells = self._cells
+        depart = start[0] * w + start[1]
+        arrivee = stop[0] * w + stop[1]
+        debut = time.perf_counter()
+        instrumentation = self.instrumentation
+        if self._tree is not None:  # labyrinthe parfait indexé : le chemin est unique
+            chemin = self._tree.path(depart, arrivee)
+            self.expanded = len(chemin)
+            if instrumentation is not None:
+                self._report_solve("solve_bfs" if largeur else "solve_dfs", debut, len(chemin), 0)
+            return [divmod(k, w) for k in chemin]
+        rappel = instrumentation.callback if instrumentation is not None else None
+        mesure = instrumentation is not None
+        pic = 0
+        predecesseurs = array('l', [-1]) * (self.height * w)
+        predecesseurs[depart] = depart
+        marque = deque([depart])
+        retirer = marque.popleft if largeur else marque.pop
+        ajouter = marque.append
+        developpees = 0
+        while marque:
+            k = retirer()
+            developpees += 1
+            if mesure:
+                pic = max(pic, len(marque) + 1)
+                if rappel is not None:
+                    rappel("expand", divmod(k, w))
+            if k == arrivee:
+                break
+            c = cells[k]
+            if c & SUD and predecesseurs[k + w] < 0:
+                predecesseurs[k + w] = k
+                ajouter(k + w)
+            if k >= w and cells[k - w] & SUD and predecesseurs[k - w] < 0:
+                predecesseurs[k - w] = k
+                ajouter(k - w)
+            if c & EST and predecesseurs[k + 1] < 0:
+                predecesseurs[k + 1] = k
+                ajouter(k + 1)
+            if k % w and cells[k - 1] & EST and predecesseurs[k - 1] < 0:
+                predecesseurs[k - 1] = k
+                ajouter(k - 1)
+        self.expanded = developpees
+        if mesure:
+            self._report_solve("solve_bfs" if largeur else "solve_dfs", debut, developpees, pic)
+        return self._path_from(predecesseurs, depart, arrivee)
+
+    def _path_from(self, predecesseurs, depart, arrivee):
+        """
+        Reconstruit le chemin de depart vers arrivee à partir d'un tableau de prédécesseurs (-1 : non atteinte).
+
+        Retour :
+            Liste des cellules du chemin, de arrivee jusqu'à la cellule qui suit depart,
+            ou None si arrivee n'a pas été atteinte
+        """
+        if predecesseurs[arrivee] < 0:
+            return None
         parcours = []
-        marque = [start]
-        predecesseurs = {start: start}
-        while marque != []:
-            cell = marque.pop(0)
-            voisins = self.get_reachable_cells(cell)
-            for i in range (len(voisins)):
-                if voisins[i] not in marque and voisins[i] != predecesseurs[cell]:
-                    marque.append(voisins[i])
-                    predecesseurs[voisins[i]] = cell
-        cell = stop
-        while cell != start:
-            parcours.append(cell)
-            cell = predecesseurs[cell]
+        k = arrivee
+        while k != depart:
+            parcours.append(divmod(k, self.width))
+            k = predecesseurs[k]
         return parcours
 
-    def solve_rhr(self, start, stop):
+    def solve_dfs(self, start, stop):
+        """
+        Calcule le parcours le plus court afin d'atteindre la cellule stop à partir de la cellule start.
+
+        Explication de l'algorithme :
+        On utilise ici un parcours en profondeur du labyrinthe. Dans l'initialisation, on choisit la cellule de départ D
+        que l'on place dans une pile et que l'on marque. Ensuite on mémorise l'élément prédécesseur de D comme étant D.
+        Tant qu'il reste des cellules non marquées : on prend la première cellule (c) de la pile. Si c correspond à
+        la cellule A (ou arrivée), on met fin à l'algorithme. Sinon : pour chaque voisine de c, on vérifie si elle
+        n'est pas marquée pour l'ajouter dans la pile et enfin mémoriser son prédecesseur comme étant c.
+
+        Arguments :
+            start (tuple): La cellule de départ
+            stop (tuple): La cellule d'arrivée
+        Retour :
+            Liste des cellules du chemin, de stop jusqu'à la cellule qui suit start
+            (None si stop n'est pas accessible depuis start)
+        """
+        return self._search(start, stop, largeur=False)
+
+    def solve_bfs (self, start, stop):
+        """
+        Calcule le parcours le plus court afin d'atteindre la cellule stop à partir de la cellule start. Ici, on utilise
+        un parcours en largeur, ce qui signifie que l'algorithme va trouver différents chemins mais on gardera le plus
+        cours d'entre eux. Le parcours s'arrête dès que la cellule stop est atteinte.
+
+        Arguments :
+             start (tuple) : La cellule de départ
+             stop (tuple) : La cellule d'arrivée
+        Retour :
+             Liste des cellules du chemin, de stop jusqu'à la cellule qui suit start
+             (None si stop n'est pas accessible depuis start)
+        """
+        return self._search(start, stop, largeur=True)
+
+    def solve_rhr(self, start, stop, max_steps=None):
         """
         Génère un chemin pour aller de la cellule start à la cellule stop. Ici, on utilise l'algorithme de la main droite
         qui suit la fameuse méthode pour qu'une personne perdue retrouve la sortie d'un labyrinthe : il faut toujours
         longer les murs situés du côté de notre main droite.
+        Le trajet est celui de walk_rhr ; on en retire les allers-retours dans les impasses et les boucles, ce qui donne
+        dans un labyrinthe parfait le chemin unique de start à stop.
 
         Arguments :
              start (tuple) : La cellule de départ
              stop (tuple) : La cellule d'arrivée
+             max_steps (int) : nombre maximal de déplacements (None : pas de limite)
         Retour :
-             Nombre minimal de déplacements nécessaires pour aller de start à stop
+             Liste des cellules du chemin, de stop jusqu'à la cellule qui suit start
+             (None si le mur suivi ne mène pas à stop, ou si max_steps déplacements ne suffisent pas)
         """
+        debut = time.perf_counter()
+        instrumentation = self.instrumentation
+        rappel = instrumentation.callback if instrumentation is not None else None
+        chemin = [start]
+        position = {start: 0}
+        pas = 0
+        for cell in self.walk_rhr(start, stop, max_steps):
+            pas += 1
+            if rappel is not None:
+                rappel("expand", cell)
+            p = position.get(cell)
+            if p is not None:  # retour sur nos pas : on efface l'impasse ou la boucle
+                for boucle in chemin[p + 1:]:
+                    del position[boucle]
+                del chemin[p + 1:]
+            else:
+                position[cell] = len(chemin)
+                chemin.append(cell)
+        self.expanded = pas
+        if instrumentation is not None:
+            self._report_solve("solve_rhr", debut, pas, 1)
+        if chemin[-1] != stop:
+            return None
+        chemin.reverse()
+        chemin.pop()
+        return chemin
+
+    def walk_rhr(self, start, stop, max_steps=None):
+        """
+        Suit le mur de droite depuis la cellule start et produit, au fur et à mesure, chaque cellule atteinte
+        (allers-retours compris). Seules la cellule courante et la direction de marche sont mémorisées : la mémoire
+        utilisée est constante, quelle que soit la taille du labyrinthe.
+        À chaque pas, on essaie de tourner à droite, sinon d'aller tout droit, sinon à gauche, sinon on fait demi-tour.
+        Ce déplacement est une permutation des couples (cellule, direction) : si stop n'est pas le long du mur suivi
+        (composante différente, ou îlot dans un labyrinthe non parfait), on finit par revenir dans l'état atteint au
+        premier pas, et la marche s'arrête.
+        Si aucun mur ne touche start (salle ouverte), on avance d'abord tout droit vers le NORD jusqu'à longer un mur
+        (ou le heurter, on tourne alors à gauche pour l'avoir à droite), puis on applique la règle.
+
+        Arguments :
+            start (tuple) : La cellule de départ
+            stop (tuple) : La cellule d'arrivée
+            max_steps (int) : nombre maximal de déplacements (None : pas de limite)
+
+        Retour :
+            Générateur des cellules (tuples) successives ; la dernière est stop si elle a été atteinte
+
+        Exemple (labyrinthe sans murs intérieurs) :
+            >>> list(Maze(3, 3, True).walk_rhr((1, 1), (0, 0)))
+            [(0, 1), (0, 0)]
+            >>> Maze(10, 10, True).solve_rhr((5, 5), (0, 0))
+            [(0, 0), (0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (1, 5), (2, 5), (3, 5), (4, 5)]
+        """
+        w = self.width
+        cells = self._cells
+        i, j = start
+        k = i * w + j
+        arrivee = stop[0] * w + stop[1]
+        if k == arrivee:
+            return
+        # directions dans le sens des aiguilles d'une montre : NORD, EST, SUD, OUEST
+        decalages = (-w, 1, w, -1)
+
+        def ouvert(k, d):
+            if d == 0:
+                return k >= w and cells[k - w] & SUD
+            if d == 1:
+                return cells[k] & EST
+            if d == 2:
+                return cells[k] & SUD
+            return k % w and cells[k - 1] & EST
+
+        # on part avec un mur à droite, s'il y en a un
+        direction = next((d for d in range(4) if not ouvert(k, (d + 1) & 3)), None)
+        pas = 0
+        if direction is None:  # aucun mur autour de start : tout droit vers le NORD jusqu'à avoir un mur à droite
+            direction = 0
+            while ouvert(k, (direction + 1) & 3):
+                if not ouvert(k, direction):  # mur devant : on tourne à gauche, il est alors à droite
+                    direction = (direction - 1) & 3
+                    break
+                if max_steps is not None and pas >= max_steps:
+                    return
+                k += decalages[direction]
+                pas += 1
+                yield divmod(k, w)
+                if k == arrivee:
+                    return
+        premier = None  # état (cellule, direction) après le premier pas de la règle de la main droite
+        while max_steps is None or pas < max_steps:
+            for tour in (1, 0, 3, 2):  # droite, tout droit, gauche, demi-tour
+                d = (direction + tour) & 3
+                if ouvert(k, d):
+                    break
+            else:
+                return  # cellule emmurée
+            direction = d
+            k += decalages[d]
+            if premier is None:
+                premier = (k, d)
+            elif premier == (k, d):
+                return  # boucle : stop n'est pas le long de ce mur
+            pas += 1
+            yield divmod(k, w)
+            if k == arrivee:
+                return
+
+    def solve_astar(self, start, stop):
+        """
+        Calcule le parcours le plus court afin d'atteindre la cellule stop à partir de la cellule start avec
+        l'algorithme A*.
+
+        Explication de l'algorithme :
+        On développe toujours la cellule c qui minimise g(c) + h(c), où g(c) est le nombre de déplacements depuis start
+        et h(c) la distance de Manhattan entre c et stop (qui ne surestime jamais la distance réelle). Les cellules à
+        développer sont rangées dans un tas ; le nombre de cellules développées est mémorisé dans 'expanded'.
+
+        Arguments :
+             start (tuple) : La cellule de départ
+             stop (tuple) : La cellule d'arrivée
+        Retour :
+             Liste des cellules du chemin, de stop jusqu'à la cellule qui suit start
+             (None si stop n'est pas accessible depuis start)
+        """
+        w = self.width
+        cells = self._cells
+        n = self.height * w
+        depart = start[0] * w + start[1]
+        arrivee = stop[0] * w + stop[1]
+        ti, tj = stop
+        predecesseurs = array('l', [-1]) * n
+        predecesseurs[depart] = depart
+        cout = array('l', [-1]) * n  # nombre de déplacements depuis start (-1 : pas encore atteinte)
+        cout[depart] = 0
+        tas = [(self.distance_man(start, stop), 0, depart)]  # (g + h, -g, cellule) : à égalité, la plus avancée
+        debut = time.perf_counter()
+        instrumentation = self.instrumentation
+        rappel = instrumentation.callback if instrumentation is not None else None
+        mesure = instrumentation is not None
+        pic = 0
+        developpees = 0
+        while tas:
+            f, g, k = heapq.heappop(tas)
+            g = -g
+            if g > cout[k]:  # entrée périmée
+                continue
+            developpees += 1
+            if mesure:
+                pic = max(pic, len(tas) + 1)
+                if rappel is not None:
+                    rappel("expand", divmod(k, w))
+            if k == arrivee:
+                break
+            g += 1
+            c = cells[k]
+            voisines = []
+            if c & SUD:
+                voisines.append(k + w)
+            if k >= w and cells[k - w] & SUD:
+                voisines.append(k - w)
+            if c & EST:
+                voisines.append(k + 1)
+            if k % w and cells[k - 1] & EST:
+                voisines.append(k - 1)
+            for v in voisines:
+                if cout[v] < 0 or g < cout[v]:
+                    cout[v] = g
+                    predecesseurs[v] = k
+                    i, j = divmod(v, w)
+                    heapq.heappush(tas, (g + abs(ti - i) + abs(tj - j), -g, v))
+        self.expanded = developpees
+        if mesure:
+            self._report_solve("solve_astar", debut, developpees, pic)
+        return self._path_from(predecesseurs, depart, arrivee)
+
+    def solve_bidir(self, start, stop):
+        """
+        Calcule le parcours le plus court afin d'atteindre la cellule stop à partir de la cellule start avec un parcours
+        en largeur bidirectionnel.
+
+        Explication de l'algorithme :
+        On lance simultanément un parcours en largeur depuis start et un autre depuis stop. À chaque tour, on développe
+        un niveau complet de la frontière la plus petite ; dès qu'une cellule atteinte par un côté a déjà été atteinte
+        par l'autre, les deux parcours se sont rejoints et on garde la meilleure jonction du niveau. Le nombre de
+        cellules développées est mémorisé dans 'expanded'.
+
+        Arguments :
+             start (tuple) : La cellule de départ
+             stop (tuple) : La cellule d'arrivée
+        Retour :
+             Liste des cellules du chemin, de stop jusqu'à la cellule qui suit start
+             (None si stop n'est pas accessible depuis start)
+        """
+        w = self.width
+        n = self.height * w
+        depart = start[0] * w + start[1]
+        arrivee = stop[0] * w + stop[1]
+        self.expanded = 0
+        if depart == arrivee:
+            return []
+        pred_depart = array('l', [-1]) * n
+        pred_arrivee = array('l', [-1]) * n
+        dist_depart = array('l', [-1]) * n
+        dist_arrivee = array('l', [-1]) * n
+        pred_depart[depart] = depart
+        pred_arrivee[arrivee] = arrivee
+        dist_depart[depart] = 0
+        dist_arrivee[arrivee] = 0
+        frontiere_depart = [depart]
+        frontiere_arrivee = [arrivee]
+        debut = time.perf_counter()
+        instrumentation = self.instrumentation
+        rappel = instrumentation.callback if instrumentation is not None else None
+        pic = 0
+        developpees = 0
+        jonction = None  # (longueur, cellule côté start, cellule côté stop)
+        while frontiere_depart and frontiere_arrivee and jonction is None:
+            cote_depart = len(frontiere_depart) <= len(frontiere_arrivee)
+            if cote_depart:
+                frontiere, pred, dist, dist_autre = frontiere_depart, pred_depart, dist_depart, dist_arrivee
+            else:
+                frontiere, pred, dist, dist_autre = frontiere_arrivee, pred_arrivee, dist_arrivee, dist_depart
+            suivante = []
+            pic = max(pic, len(frontiere_depart) + len(frontiere_arrivee))
+            for k in frontiere:
+                developpees += 1
+                if rappel is not None:
+                    rappel("expand", divmod(k, w))
+                d = dist[k] + 1
+                for v in self._reachable_ids(k):
+                    if dist_autre[v] >= 0:  # les deux parcours se rejoignent
+                        longueur = d + dist_autre[v]
+                        if jonction is None or longueur < jonction[0]:
+                            jonction = (longueur, k, v) if cote_depart else (longueur, v, k)
+                    elif dist[v] < 0:
+                        dist[v] = d
+                        pred[v] = k
+                        suivante.append(v)
+            if cote_depart:
+                frontiere_depart = suivante
+            else:
+                frontiere_arrivee = suivante
+        self.expanded = developpees
+        if instrumentation is not None:
+            self._report_solve("solve_bidir", debut, developpees, pic)
+        if jonction is None:
+            return None
+        _, u, v = jonction
         parcours = []
-        marque = [start]
-        predecesseurs = {start: start}
-        while marque != []:
-            cell = marque.pop(0)
-            if cell==stop :
-                marque = []
-            voisins = self.get_reachable_cells(cell)
-            for i in range(len(voisins)):
-                if voisins[i] not in marque and voisins[i] != predecesseurs[cell]:
-                    marque.append(voisins[i])
-                    predecesseurs[voisins[i]] = cell
-        cell = stop
-        while cell != start:
-            parcours.append(cell)
-            cell = predecesseurs[cell]
-        return parcours
+        while v != arrivee:  # de la jonction vers stop, côté stop
+            parcours.append(v)
+            v = pred_arrivee[v]
+        parcours.append(arrivee)
+        parcours.reverse()
+        while u != depart:  # de la jonction vers start, côté start
+            parcours.append(u)
+            u = pred_depart[u]
+        return [divmod(k, w) for k in parcours]
+
+    def _distances_from(self, depart):
+        """
+        Parcours en largeur complet depuis une cellule.
+
+        Argument :
+            depart (int) : identifiant de la cellule source
+
+        Retour :
+            array d'entiers : distance de chaque cellule à la source (-1 si la cellule n'est pas accessible)
+        """
+        w = self.width
+        cells = self._cells
+        distances = array('i', [-1]) * (self.height * w)
+        distances[depart] = 0
+        marque = deque([depart])
+        retirer = marque.popleft
+        ajouter = marque.append
+        while marque:
+            k = retirer()
+            d = distances[k] + 1
+            c = cells[k]
+            if c & SUD and distances[k + w] < 0:
+                distances[k + w] = d
+                ajouter(k + w)
+            if k >= w and cells[k - w] & SUD and distances[k - w] < 0:
+                distances[k - w] = d
+                ajouter(k - w)
+            if c & EST and distances[k + 1] < 0:
+                distances[k + 1] = d
+                ajouter(k + 1)
+            if k % w and cells[k - 1] & EST and distances[k - 1] < 0:
+                distances[k - 1] = d
+                ajouter(k - 1)
+        return distances
+
+    def distance_field(self, c):
+        """
+        Retourne le champ des distances géodésiques depuis la cellule c. Le champ est calculé une seule fois
+        puis conservé dans un cache LRU d'au plus 'distance_cache_size' champs, qui occupent au plus
+        'distance_cache_bytes' octets (sur une très grande grille, un champ plus gros que ce budget n'est pas gardé) ;
+        le cache est vidé à chaque modification des murs (add_wall, remove_wall, fill, empty).
+
+        Argument :
+            c (tuple) : cellule source
+
+        Retour :
+            array d'entiers indexé par identifiant de cellule (l * width + c) : distance à la source,
+            -1 si la cellule n'est pas accessible
+        """
+        depart = c[0] * self.width + c[1]
+        distances = self._distances.get(depart)
+        if distances is not None:
+            self.cache_hits += 1
+            self._distances.move_to_end(depart)
+            return distances
+        self.cache_misses += 1
+        distances = self._distances_from(depart)
+        taille = len(distances) * distances.itemsize
+        maximum = min(self.distance_cache_size, self.distance_cache_bytes // max(taille, 1))
+        if maximum > 0:
+            self._distances[depart] = distances
+            while len(self._distances) > maximum:
+                self._distances.popitem(last=False)
+        return distances
+
+    def distance_cache_info(self):
+        """
+        Statistiques du cache des champs de distances.
+
+        Retour :
+            dictionnaire : hits, misses, size (nombre de champs en cache), maxsize, bytes (mémoire occupée par les
+            champs en cache) et maxbytes
+        """
+        taille = 4 * self.height * self.width
+        return {"hits": self.cache_hits, "misses": self.cache_misses,
+                "size": len(self._distances), "maxsize": self.distance_cache_size,
+                "bytes": len(self._distances) * taille, "maxbytes": self.distance_cache_bytes}
 
     def distance_geo(self,c1, c2):
         """
-        Calcule la distance géodésique entree la cellule c1 et la cellule c2. Ici, on utilise la méthode "solve_dfs"
-        définie au-dessus, on calcule donc la taille du parcours le plus cours trouvée par cette dernière. Attention ici
-        on prend en compte les murs présent dans le labyrinthe !
+        Calcule la distance géodésique entree la cellule c1 et la cellule c2. Ici, on utilise le champ des distances
+        depuis c1 (voir distance_field), calculé par un parcours en largeur et conservé en cache : les appels suivants
+        depuis la même cellule c1 sont immédiats (avec l'index d'arbre, voir build_tree_index, le calcul est en
+        O(log n)). Attention ici on prend en compte les murs présent dans le labyrinthe !
 
         Arguments :
             c1 (tuple): Cellule 1
             c2 (tuple): Cellule 2
         Retour :
-            Nombre minimal de déplacements nécessaires pour aller de c1 à c2
+            Nombre minimal de déplacements nécessaires pour aller de c1 à c2 (None si c2 n'est pas accessible)
         """
-        return len(self.solve_dfs(c1,c2))
+        if self._tree is not None:
+            w = self.width
+            return self._tree.distance(c1[0] * w + c1[1], c2[0] * w + c2[1])
+        d = self.distance_field(c1)[c2[0] * self.width + c2[1]]
+        return d if d >= 0 else None
+
+    def distance_matrix(self, sources, targets, workers=None):
+        """
+        Calcule les distances géodésiques de chaque cellule de sources à chaque cellule de targets.
+        Un seul parcours en largeur est fait par source distincte (les champs de distances passent par le cache de
+        distance_field) ; avec l'index d'arbre (voir build_tree_index), chaque distance est calculée en O(log n).
+        Avec workers > 1, les sources distinctes sont réparties sur un groupe de processus qui lisent le labyrinthe
+        dans un segment de mémoire partagée (voir share) : la grille n'est pas copiée dans chaque processus.
+
+        Arguments :
+            sources (list) : cellules de départ
+            targets (list) : cellules d'arrivée
+            workers (int) : nombre de processus (None ou 1 : dans le processus courant)
+
+        Retour :
+            liste de listes d'entiers : matrice[i][j] est la distance de sources[i] à targets[j] (-1 si targets[j]
+            n'est pas accessible depuis sources[i])
+        """
+        w = self.width
+        cibles = [i * w + j for i, j in targets]
+        departs = list(dict.fromkeys(i * w + j for i, j in sources))
+        if self._tree is not None:
+            distance = self._tree.distance
+            lignes = {depart: [distance(depart, cible) for cible in cibles] for depart in departs}
+        elif workers is None or workers <= 1 or len(departs) < 2:
+            lignes = {}
+            for depart in departs:
+                distances = self.distance_field(divmod(depart, w))
+                lignes[depart] = list(map(distances.__getitem__, cibles))
+        else:
+            segment = self.share()
+            try:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_attach_shared,
+                                         initargs=(segment.name, cibles)) as executeur:
+                    morceau = max(1, len(departs) // (4 * workers))
+                    lignes = dict(zip(departs, executeur.map(_distance_row, departs, chunksize=morceau)))
+            finally:
+                Maze.unshare(segment)
+        return [list(lignes[i * w + j]) for i, j in sources]
+
+    def build_tree_index(self, root=(0, 0)):
+        """
+        Construit l'index d'arbre d'un labyrinthe parfait (c'est le cas de tous les labyrinthes générés par les
+        méthodes gen_*). L'arbre est enraciné en root ; ensuite distance_geo répond en O(log n) grâce au plus proche
+        ancêtre commun et les méthodes solve_* extraient le chemin en temps linéaire en sa longueur.
+        L'index est supprimé à la première modification des murs.
+
+        Argument :
+            root (tuple) : cellule racine de l'arbre
+
+        Retour :
+            Rien (lève ValueError si le labyrinthe n'est pas parfait)
+        """
+        self._tree = _TreeIndex(self, root[0] * self.width + root[1])
+
+    def build_connectivity_index(self):
+        """
+        Construit l'index des composantes connexes du labyrinthe (un parcours complet). L'index est ensuite tenu à
+        jour par add_wall et remove_wall : ouvrir un passage coûte au plus la taille de la plus petite des deux
+        composantes fusionnées, fermer un passage au plus deux fois la taille de la plus petite des deux parties
+        (si elles se séparent). fill et empty le reconstruisent en un seul parcours.
+
+        Retour :
+            Rien
+        """
+        self._connectivity = _ConnectivityIndex(self)
+
+    def connected(self, c1, c2):
+        """
+        Indique si la cellule c2 est accessible depuis la cellule c1, sans parcours du labyrinthe
+        (l'index des composantes est construit au premier appel, voir build_connectivity_index).
+
+        Arguments :
+            c1 (tuple): Cellule 1
+            c2 (tuple): Cellule 2
+        Retour :
+            booléen
+        """
+        if self._connectivity is None:
+            self.build_connectivity_index()
+        w = self.width
+        return self._connectivity.connected(c1[0] * w + c1[1], c2[0] * w + c2[1])
+
+    def component_count(self):
+        """
+        Retourne le nombre de composantes connexes du labyrinthe (1 pour un labyrinthe parfait)
+        (l'index des composantes est construit au premier appel, voir build_connectivity_index).
+        """
+        if self._connectivity is None:
+            self.build_connectivity_index()
+        return self._connectivity.component_count()
+
+    def lca(self, c1, c2):
+        """
+        Retourne le plus proche ancêtre commun de deux cellules dans l'index d'arbre (voir build_tree_index).
+
+        Arguments :
+            c1 (tuple): Cellule 1
+            c2 (tuple): Cellule 2
+        Retour :
+            Cellule (tuple) ancêtre commun de c1 et c2 le plus profond
+        """
+        assert self._tree is not None, "L'index d'arbre n'est pas construit (voir build_tree_index)"
+        w = self.width
+        return divmod(self._tree.lca(c1[0] * w + c1[1], c2[0] * w + c2[1]), w)
 
     def distance_man(self,c1, c2):
         """
@@ -598,4 +2406,350 @@ class Maze:
         Retour :
             Nombre minimal de déplacements nécessaires pour aller de c1 à c2
         """
-        return (c2[0] - c1[0]) + (c2[1] - c1[1])
\ No newline at end of file
+        return abs(c2[0] - c1[0]) + abs(c2[1] - c1[1])
+
+
+
+class ChunkedMaze:
+    """
+    Labyrinthe illimité découpé en tuiles de tile_height x tile_width cellules, générées à la demande.
+    Les coordonnées (l, c) des cellules sont des entiers quelconques (éventuellement négatifs) : la tuile (tl, tc)
+    contient les cellules (l, c) telles que l // tile_height == tl et c // tile_width == tc.
+
+    Chaque tuile est un labyrinthe parfait produit par une méthode gen_* avec une graine dérivée de (seed, tl, tc) :
+    elle est donc identique à chaque génération. La tuile possède ses bords EST et SUD ; sur chacun, un seul passage
+    est ouvert, à une position dérivée de (seed, tl, tc, bord), ce qui garantit que toutes les cellules sont reliées
+    (il existe des cycles entre tuiles). La position d'un passage ne dépend que de la graine : connaître les passages
+    d'une cellule ne demande jamais de générer les tuiles voisines.
+
+    Les tuiles générées sont conservées dans un cache LRU dont la taille est limitée par memory_budget (en octets,
+    un octet par cellule) ; une tuile évincée est simplement régénérée au besoin. Les méthodes solve_* respectent
+    aussi ce budget : quand la fenêtre qui contient start et stop serait plus grande, elles résolvent tuile par tuile
+    le long d'une route de tuiles voisines (chemin valide, mais pas forcément le plus court).
+    """
+    def __init__(self, tile_height=64, tile_width=64, seed=0, algorithm="fusion", memory_budget=64 * 2 ** 20):
+        """
+        Arguments :
+            tile_height (int) : nombre de lignes d'une tuile
+            tile_width (int) : nombre de colonnes d'une tuile
+            seed (int) : graine globale du labyrinthe
+            algorithm (str) : algorithme de génération des tuiles (nom d'une méthode gen_* sans le préfixe)
+            memory_budget (int) : mémoire maximale occupée par les tuiles en cache (au moins une tuile est gardée)
+        """
+        if tile_height < 1 or tile_width < 1:
+            raise ValueError("les tuiles doivent avoir au moins une ligne et une colonne")
+        if not hasattr(Maze, "gen_" + algorithm):
+            raise ValueError(f"algorithme de génération inconnu : {algorithm}")
+        self.tile_height     = tile_height
+        self.tile_width      = tile_width
+        self.seed            = seed
+        self.algorithm       = algorithm
+        self.memory_budget   = memory_budget
+        self.instrumentation = None  # transmise aux fenêtres (voir Instrumentation)
+        self._tiles          = OrderedDict()  # (tl, tc) -> bytearray de tile_height * tile_width octets
+        self.tiles_generated = 0
+        self.cache_hits      = 0
+        self.cache_misses    = 0
+
+    def _border(self, tl, tc, bord):
+        """
+        Position du passage ouvert sur le bord EST (numéro de ligne) ou SUD (numéro de colonne) de la tuile (tl, tc).
+        """
+        if bord == EST:
+            return _derived_seed(self.seed, f"{tl},{tc},E") % self.tile_height
+        return _derived_seed(self.seed, f"{tl},{tc},S") % self.tile_width
+
+    def _tile(self, tl, tc):
+        """
+        Retourne les passages de la tuile (tl, tc), en la générant si elle n'est pas dans le cache.
+        """
+        cle = (tl, tc)
+        tuile = self._tiles.get(cle)
+        if tuile is not None:
+            self.cache_hits += 1
+            self._tiles.move_to_end(cle)
+            return tuile
+        self.cache_misses += 1
+        th, tw = self.tile_height, self.tile_width
+        graine = _derived_seed(self.seed, f"{tl},{tc}")
+        tuile = getattr(Maze, "gen_" + self.algorithm)(th, tw, rng=random.Random(graine))._cells
+        tuile[self._border(tl, tc, EST) * tw + tw - 1] |= EST
+        tuile[(th - 1) * tw + self._border(tl, tc, SUD)] |= SUD
+        self.tiles_generated += 1
+        self._tiles[cle] = tuile
+        maximum = max(1, self.memory_budget // (th * tw))
+        while len(self._tiles) > maximum:
+            self._tiles.popitem(last=False)
+        return tuile
+
+    def cache_info(self):
+        """
+        Statistiques du cache des tuiles.
+
+        Retour :
+            dictionnaire : hits, misses, generated, size (nombre de tuiles en cache), maxsize et bytes
+        """
+        taille = self.tile_height * self.tile_width
+        return {"hits": self.cache_hits, "misses": self.cache_misses, "generated": self.tiles_generated,
+                "size": len(self._tiles), "maxsize": max(1, self.memory_budget // taille),
+                "bytes": len(self._tiles) * taille}
+
+    def get_reachable_cells(self, c):
+        """
+        Retourne la liste des cellules accessibles depuis la cellule c (seule la tuile de c est générée).
+
+        Argument :
+            c (tuple) : coordonnée de la cellule (ligne, colonne)
+
+        Retour :
+            liste_accessibles : Liste de tuples représentant les coordonnées des cellules accessibles
+        """
+        liste_accessibles = []
+        i, j = c
+        th, tw = self.tile_height, self.tile_width
+        tl, l = divmod(i, th)
+        tc, col = divmod(j, tw)
+        tuile = self._tile(tl, tc)
+        k = l * tw + col
+        if tuile[k] & SUD:
+            liste_accessibles.append((i + 1, j))
+        if (tuile[k - tw] & SUD) if l > 0 else self._border(tl - 1, tc, SUD) == col:
+            liste_accessibles.append((i - 1, j))
+        if tuile[k] & EST:
+            liste_accessibles.append((i, j + 1))
+        if (tuile[k - 1] & EST) if col > 0 else self._border(tl, tc - 1, EST) == l:
+            liste_accessibles.append((i, j - 1))
+        return liste_accessibles
+
+    def window(self, top, left, height, width):
+        """
+        Extrait une fenêtre rectangulaire du labyrinthe. Seules les tuiles qui recouvrent la fenêtre sont générées.
+        La fenêtre est une copie de height x width octets qui s'ajoute à memory_budget : c'est à l'appelant d'en
+        limiter la taille.
+
+        Arguments :
+            top, left (int) : coordonnées de la cellule en haut à gauche de la fenêtre
+            height, width (int) : dimensions de la fenêtre
+
+        Retour :
+            Maze de height x width cellules ; la cellule (l, c) de la fenêtre est la cellule (top + l, left + c)
+            du labyrinthe (les passages qui sortent de la fenêtre sont fermés)
+        """
+        th, tw = self.tile_height, self.tile_width
+        cells = bytearray(height * width)
+        for tl in range(top // th, (top + height - 1) // th + 1):
+            l0 = max(top, tl * th)
+            l1 = min(top + height, (tl + 1) * th)
+            for tc in range(left // tw, (left + width - 1) // tw + 1):
+                c0 = max(left, tc * tw)
+                c1 = min(left + width, (tc + 1) * tw)
+                tuile = self._tile(tl, tc)
+                for i in range(l0, l1):
+                    source = (i - tl * th) * tw - tc * tw
+                    cible = (i - top) * width - left
+                    cells[cible + c0:cible + c1] = tuile[source + c0:source + c1]
+        if height > 0 and width > 0:
+            cells[width - 1::width] = bytes(cells[width - 1::width]).translate(_SANS_EST)
+            cells[(height - 1) * width:] = bytes(cells[(height - 1) * width:]).translate(_SANS_SUD)
+        labyrinthe = Maze._from_cells(height, width, cells)
+        labyrinthe.algorithm = self.algorithm
+        labyrinthe.instrumentation = self.instrumentation
+        return labyrinthe
+
+    def _solve(self, methode, start, stop, margin):
+        """
+        Résout dans la plus petite fenêtre alignée sur les tuiles qui contient start et stop, élargie de margin tuiles
+        de chaque côté. Comme chaque tuile est d'un seul tenant et reliée à ses voisines, cette fenêtre contient
+        toujours un chemin, que solve_dfs, solve_bfs, solve_astar et solve_bidir trouvent ; le plus court chemin du
+        labyrinthe peut cependant en sortir (margin l'autorise). La fenêtre contient des cycles (entre les tuiles) :
+        solve_rhr, qui suit un mur, peut tourner autour d'un îlot sans atteindre stop et renvoyer None.
+        Si la fenêtre occupe plus de memory_budget octets, on passe par _solve_by_tiles.
+        """
+        th, tw = self.tile_height, self.tile_width
+        top = (min(start[0], stop[0]) // th - margin) * th
+        left = (min(start[1], stop[1]) // tw - margin) * tw
+        bas = (max(start[0], stop[0]) // th + margin + 1) * th
+        droite = (max(start[1], stop[1]) // tw + margin + 1) * tw
+        if (bas - top) * (droite - left) > self.memory_budget:
+            return self._solve_by_tiles(methode, start, stop)
+        fenetre = self.window(top, left, bas - top, droite - left)
+        parcours = getattr(fenetre, methode)((start[0] - top, start[1] - left), (stop[0] - top, stop[1] - left))
+        if parcours is None:
+            return None
+        return [(i + top, j + left) for i, j in parcours]
+
+    def _tile_route(self, depart, arrivee):
+        """
+        Suite de tuiles voisines de la tuile depart à la tuile arrivee : deux tuiles voisines sont toujours reliées
+        par un passage, on avance donc à chaque pas dans la direction (ligne ou colonne) où il reste,
+        proportionnellement, le plus de chemin à faire, pour suivre au plus près la diagonale.
+        """
+        (tl, tc), (al, ac) = depart, arrivee
+        total_l, total_c = max(abs(al - tl), 1), max(abs(ac - tc), 1)
+        route = [(tl, tc)]
+        while (tl, tc) != (al, ac):
+            if abs(al - tl) * total_c >= abs(ac - tc) * total_l:
+                tl += 1 if al > tl else -1
+            else:
+                tc += 1 if ac > tc else -1
+            route.append((tl, tc))
+        return route
+
+    def _crossing(self, tuile, voisine):
+        """
+        Passage entre deux tuiles voisines : (cellule de la tuile, cellule de la voisine).
+        """
+        th, tw = self.tile_height, self.tile_width
+        (tl, tc), (vl, vc) = tuile, voisine
+        if vc == tc + 1:
+            l = tl * th + self._border(tl, tc, EST)
+            return (l, tc * tw + tw - 1), (l, vc * tw)
+        if vc == tc - 1:
+            l = tl * th + self._border(vl, vc, EST)
+            return (l, tc * tw), (l, tc * tw - 1)
+        if vl == tl + 1:
+            c = tc * tw + self._border(tl, tc, SUD)
+            return (tl * th + th - 1, c), (vl * th, c)
+        c = tc * tw + self._border(vl, vc, SUD)
+        return (tl * th, c), (tl * th - 1, c)
+
+    def _solve_by_tiles(self, methode, start, stop):
+        """
+        Résout sans construire de grande fenêtre : on choisit une suite de tuiles voisines de la tuile de start à celle
+        de stop (voir _tile_route), puis on résout dans chaque tuile, l'une après l'autre, entre la cellule par laquelle
+        on y entre et celle par laquelle on en sort. Seules les tuiles de la route sont générées, et une seule fenêtre
+        d'une tuile existe à la fois. Chaque tuile est un labyrinthe parfait : toutes les méthodes (solve_rhr compris)
+        y trouvent le chemin, mais le chemin complet n'est pas forcément le plus court.
+        """
+        th, tw = self.tile_height, self.tile_width
+        route = self._tile_route((start[0] // th, start[1] // tw), (stop[0] // th, stop[1] // tw))
+        parcours = []  # cellules dans l'ordre de la marche, sans start
+        entree = start
+        for numero, (tl, tc) in enumerate(route):
+            if numero + 1 < len(route):
+                sortie, suivante = self._crossing((tl, tc), route[numero + 1])
+            else:
+                sortie, suivante = stop, None
+            top, left = tl * th, tc * tw
+            fenetre = self.window(top, left, th, tw)
+            morceau = getattr(fenetre, methode)((entree[0] - top, entree[1] - left), (sortie[0] - top, sortie[1] - left))
+            if morceau is None:
+                return None
+            parcours.extend((i + top, j + left) for i, j in reversed(morceau))
+            if suivante is not None:
+                parcours.append(suivante)
+                entree = suivante
+        parcours.reverse()
+        return parcours
+
+    def solve_dfs(self, start, stop, margin=0):
+        """
+        Comme Maze.solve_dfs, dans la fenêtre alignée sur les tuiles qui contient start et stop (élargie de margin
+        tuiles de chaque côté). Seules les tuiles de cette fenêtre sont générées.
+
+        Retour :
+            Liste des cellules du chemin, de stop jusqu'à la cellule qui suit start
+        """
+        return self._solve("solve_dfs", start, stop, margin)
+
+    def solve_bfs(self, start, stop, margin=0):
+        """
+        Comme Maze.solve_bfs, dans la fenêtre alignée sur les tuiles qui contient start et stop (élargie de margin
+        tuiles de chaque côté) : le chemin est le plus court de cette fenêtre.
+
+        Retour :
+            Liste des cellules du chemin, de stop jusqu'à la cellule qui suit start
+        """
+        return self._solve("solve_bfs", start, stop, margin)
+
+    def solve_rhr(self, start, stop, margin=0):
+        """
+        Comme Maze.solve_rhr, dans la fenêtre alignée sur les tuiles qui contient start et stop (élargie de margin
+        tuiles de chaque côté). Les tuiles sont reliées entre elles par plusieurs passages : la fenêtre contient des
+        cycles et le mur suivi ne mène pas toujours à stop (utiliser alors une autre méthode solve_*).
+
+        Retour :
+            Liste des cellules du chemin, de stop jusqu'à la cellule qui suit start
+            (None si le mur suivi ne mène pas à stop)
+        """
+        return self._solve("solve_rhr", start, stop, margin)
+
+    def solve_astar(self, start, stop, margin=0):
+        """
+        Comme Maze.solve_astar, dans la fenêtre alignée sur les tuiles qui contient start et stop (élargie de margin
+        tuiles de chaque côté) : le chemin est le plus court de cette fenêtre.
+
+        Retour :
+            Liste des cellules du chemin, de stop jusqu'à la cellule qui suit start
+        """
+        return self._solve("solve_astar", start, stop, margin)
+
+    def solve_bidir(self, start, stop, margin=0):
+        """
+        Comme Maze.solve_bidir, dans la fenêtre alignée sur les tuiles qui contient start et stop (élargie de margin
+        tuiles de chaque côté) : le chemin est le plus court de cette fenêtre.
+
+        Retour :
+            Liste des cellules du chemin, de stop jusqu'à la cellule qui suit start
+        """
+        return self._solve("solve_bidir", start, stop, margin)
+
+    def overlay(self, top, left, height, width, content=None):
+        """
+        Rendu en mode texte d'une fenêtre du labyrinthe, avec du contenu dans les cellules.
+
+        Arguments :
+            top, left, height, width (int) : fenêtre à afficher (voir window)
+            content (dict) : dictionnaire tq content[cell] contient le caractère à afficher au milieu de la cellule
+                             (coordonnées du labyrinthe ; les cellules hors de la fenêtre sont ignorées)
+        Retour :
+            string
+        """
+        fenetre = self.window(top, left, height, width)
+        if content is not None:
+            content = {(i - top, j - left): texte for (i, j), texte in content.items()
+                       if top <= i < top + height and left <= j < left + width}
+        return fenetre.overlay(content)
+
+
+def _derived_seed(seed, numero):
+    """
+    Graine du labyrinthe numéro 'numero' d'une série de graine 'seed' (entier positif sur 63 bits).
+    """
+    empreinte = hashlib.sha256(f"{seed}:{numero}".encode("ascii")).digest()
+    return int.from_bytes(empreinte[:8], "little") >> 1
+
+
+def _generate_one(tache):
+    """
+    Génère un labyrinthe de Maze.generate_many (fonction de module pour pouvoir être envoyée aux processus).
+    """
+    algorithm, h, w, graine, directory, numero = tache
+    labyrinthe = getattr(Maze, "gen_" + algorithm)(h, w, rng=random.Random(graine))
+    labyrinthe.seed = graine
+    if directory is None:
+        return labyrinthe
+    chemin = os.path.join(directory, f"{algorithm}_{numero:06d}.amz")
+    labyrinthe.save(chemin)
+    return chemin
+
+
+# Labyrinthe partagé et cellules d'arrivée d'un processus de Maze.distance_matrix
+_partage = None
+
+
+def _attach_shared(nom, cibles):
+    """
+    Initialise un processus de Maze.distance_matrix : s'attache au labyrinthe partagé.
+    """
+    global _partage
+    _partage = (Maze.attach(nom), cibles)
+
+
+def _distance_row(depart):
+    """
+    Calcule une ligne de Maze.distance_matrix dans un processus.
+    """
+    labyrinthe, cibles = _partage
+    distances = labyrinthe._distances_from(depart)
+    return list(map(distances.__getitem__, cibles))
@@ -0,0 +1,177 @@
+"""
+Statistiques de difficulté des labyrinthes (impasses, couloirs, carrefours, diamètre, virages, distances).
+
+Toutes les mesures sont obtenues en quelques parcours linéaires : les degrés et les formes des cellules sont calculés
+d'un bloc sur les octets du labyrinthe (translate), le diamètre par deux parcours en largeur et l'histogramme des
+distances à partir du champ des distances de Maze.
+
+Utilisation :
+    python analytics.py                                        # compare tous les algorithmes (32 x 32, 100 labyrinthes)
+    python analytics.py --algorithms btree wilson --count 1000 --workers 4
+"""
+import argparse
+import json
+import statistics
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from Maze import Maze, EST, SUD
+
+# Forme d'une cellule : code sur 4 bits des passages ouverts (1 : EST, 2 : SUD, 4 : NORD, 8 : OUEST)
+_NORD, _OUEST = 4, 8
+_VERS_NORD  = bytes.maketrans(bytes([0, EST, SUD, EST | SUD]), bytes([0, 0, _NORD, _NORD]))
+_VERS_OUEST = bytes.maketrans(bytes([0, EST, SUD, EST | SUD]), bytes([0, _OUEST, 0, _OUEST]))
+_DEGRES     = bytes.maketrans(bytes(range(16)), bytes(bin(code).count("1") for code in range(16)))
+_TOUT_DROIT = (EST | _OUEST, SUD | _NORD)
+_VIRAGES    = (EST | SUD, EST | _NORD, SUD | _OUEST, _NORD | _OUEST)
+
+ALGORITHMS = ["btree", "sidewinder", "fusion", "exploration", "wilson", "eller"]
+
+
+def cell_shapes(maze):
+    """
+    Calcule la forme de toutes les cellules en un seul passage sur les octets du labyrinthe.
+
+    Retour :
+        bytes : pour chaque identifiant de cellule, le code des passages ouverts (1 : EST, 2 : SUD, 4 : NORD, 8 : OUEST)
+    """
+    n = maze.height * maze.width
+    if n == 0:
+        return b""
+    cells = bytes(maze._cells)
+    # les cellules du dessus et de gauche, décalées d'une ligne et d'une colonne ; la dernière colonne n'a jamais de
+    # passage EST, le décalage d'une colonne ne crée donc pas de passage entre deux lignes
+    nord = (bytes(maze.width) + cells[:n - maze.width]).translate(_VERS_NORD)
+    ouest = (b"\0" + cells[:n - 1]).translate(_VERS_OUEST)
+    # les trois tableaux n'ont aucun bit en commun : la somme des entiers est un OU bit à bit, sans retenue
+    somme = sum(int.from_bytes(octets, "little") for octets in (cells, nord, ouest))
+    return somme.to_bytes(n, "little")
+
+
+def analyze(maze, source=(0, 0)):
+    """
+    Calcule les statistiques d'un labyrinthe.
+
+    Arguments :
+        maze (Maze) : labyrinthe à analyser
+        source (tuple) : cellule de départ de l'histogramme des distances
+
+    Retour :
+        dictionnaire :
+          - cells, passages, perfect
+          - dead_ends (une seule ouverture), corridors (deux ouvertures, dont straight tout droit et turns en virage),
+            junctions (trois ouvertures ou plus), isolated (aucune ouverture)
+          - turn_factor : proportion des couloirs qui tournent
+          - mean_corridor_length : nombre moyen de passages entre deux cellules qui ne sont pas des couloirs
+          - diameter, diameter_endpoints : plus long plus court chemin, obtenu par deux parcours en largeur (exact si
+            le labyrinthe est parfait ; sinon, minorant limité à la composante de la cellule (0, 0))
+          - histogram : histogram[d] est le nombre de cellules à distance d de source ; unreachable : cellules non
+            accessibles depuis source
+    """
+    n = maze.height * maze.width
+    formes = cell_shapes(maze)
+    degres = formes.translate(_DEGRES)
+    passages = maze._passage_count()
+    couloirs = degres.count(2)
+    virages = sum(formes.count(code) for code in _VIRAGES)
+    resultat = {
+        "cells": n,
+        "passages": passages,
+        "dead_ends": degres.count(1),
+        "corridors": couloirs,
+        "straight": sum(formes.count(code) for code in _TOUT_DROIT),
+        "turns": virages,
+        "junctions": degres.count(3) + degres.count(4),
+        "isolated": degres.count(0),
+        "turn_factor": virages / couloirs if couloirs else 0.0,
+        "mean_corridor_length": passages / max(n - couloirs - 1, 1),
+        "perfect": False,
+        "diameter": 0,
+        "diameter_endpoints": None,
+        "histogram": [],
+        "unreachable": n,
+    }
+    if n == 0:
+        return resultat
+
+    # Diamètre : la cellule la plus éloignée de (0, 0) est une extrémité d'un plus long chemin de l'arbre
+    distances = maze._distances_from(0)
+    resultat["perfect"] = passages == n - 1 and distances.count(-1) == 0
+    a = distances.index(max(distances))
+    distances = maze._distances_from(a)
+    b = distances.index(max(distances))
+    resultat["diameter"] = distances[b]
+    resultat["diameter_endpoints"] = (divmod(a, maze.width), divmod(b, maze.width))
+
+    compte = Counter(maze.distance_field(source))
+    resultat["unreachable"] = compte.pop(-1, 0)
+    resultat["histogram"] = [compte.get(d, 0) for d in range(max(compte) + 1)]
+    return resultat
+
+
+def analyze_many(mazes, source=(0, 0), workers=None):
+    """
+    Analyse une série de labyrinthes, éventuellement répartie sur plusieurs processus.
+
+    Arguments :
+        mazes : itérable de labyrinthes
+        source (tuple) : cellule de départ des histogrammes des distances
+        workers (int) : nombre de processus (None ou 1 : dans le processus courant)
+
+    Retour :
+        liste des résultats de analyze, dans l'ordre des labyrinthes
+    """
+    analyse = partial(analyze, source=source)
+    if workers is None or workers <= 1:
+        return [analyse(labyrinthe) for labyrinthe in mazes]
+    with ProcessPoolExecutor(max_workers=workers) as executeur:
+        return list(executeur.map(analyse, mazes, chunksize=16))
+
+
+def summarize(results):
+    """
+    Résume une série de résultats de analyze : pour chaque statistique numérique, moyenne, écart type, minimum et
+    maximum.
+
+    Retour :
+        dictionnaire statistique -> {"mean", "stdev", "min", "max"}
+    """
+    resume = {}
+    if not results:
+        return resume
+    for cle, valeur in results[0].items():
+        if isinstance(valeur, bool) or not isinstance(valeur, (int, float)):
+            continue
+        valeurs = [resultat[cle] for resultat in results]
+        resume[cle] = {"mean": statistics.fmean(valeurs),
+                       "stdev": statistics.pstdev(valeurs),
+                       "min": min(valeurs),
+                       "max": max(valeurs)}
+    resume["perfect"] = sum(resultat["perfect"] for resultat in results) / len(results)
+    return resume
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--algorithms", nargs="+", choices=ALGORITHMS, default=ALGORITHMS,
+                        help="algorithmes de génération à comparer")
+    parser.add_argument("--size", type=int, nargs=2, default=[32, 32], metavar=("H", "W"),
+                        help="dimensions des labyrinthes")
+    parser.add_argument("--count", type=int, default=100, help="nombre de labyrinthes par algorithme")
+    parser.add_argument("--seed", type=int, default=2023, help="graine des séries de labyrinthes")
+    parser.add_argument("--workers", type=int, help="nombre de processus")
+    args = parser.parse_args(argv)
+
+    h, w = args.size
+    resumes = {}
+    for algorithm in args.algorithms:
+        labyrinthes = Maze.generate_many(algorithm, h, w, args.count, seed=args.seed, workers=args.workers)
+        resumes[algorithm] = summarize(analyze_many(labyrinthes, workers=args.workers))
+    print(json.dumps(resumes, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
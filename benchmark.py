@@ -0,0 +1,179 @@
+"""
+Banc d'essai des méthodes de génération, de résolution et d'affichage de Maze.
+
+Chaque opération est mesurée sur une série géométrique de tailles de labyrinthes (avec des graines fixes) :
+temps d'exécution (meilleur de plusieurs essais) et pic de mémoire (mesuré avec tracemalloc lors d'un essai séparé).
+Pour chaque opération, on ajuste l'exposant k de la loi temps ~ (nombre de cellules)^k : un algorithme linéaire a un
+exposant proche de 1, un algorithme quadratique un exposant proche de 2.
+
+Utilisation :
+    python benchmark.py                                  # mesure et affiche les résultats (JSON)
+    python benchmark.py --output resultats.json          # écrit les résultats dans un fichier
+    python benchmark.py --save-baseline                  # enregistre les résultats comme référence
+    python benchmark.py --baseline bench_baseline.json   # compare à la référence (code de retour 1 si régression)
+"""
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from Maze import Maze
+
+BASELINE = "bench_baseline.json"
+SIZES    = [32, 64, 128, 256]  # côtés des labyrinthes carrés mesurés
+
+
+def _generator(nom):
+    def operation(h, w, graine):
+        return lambda: getattr(Maze, nom)(h, w, rng=random.Random(graine))
+    return operation
+
+
+def _solver(nom):
+    def operation(h, w, graine):
+        labyrinthe = Maze.gen_exploration(h, w, rng=random.Random(graine))
+        return lambda: getattr(labyrinthe, nom)((0, 0), (h - 1, w - 1))
+    return operation
+
+
+def _str(h, w, graine):
+    labyrinthe = Maze.gen_exploration(h, w, rng=random.Random(graine))
+    return lambda: str(labyrinthe)
+
+
+def _overlay(h, w, graine):
+    labyrinthe = Maze.gen_exploration(h, w, rng=random.Random(graine))
+    contenu = {c: '*' for c in labyrinthe.solve_bfs((0, 0), (h - 1, w - 1))}
+    return lambda: labyrinthe.overlay(contenu)
+
+
+# nom de l'opération -> fonction (h, w, graine) qui prépare les données et renvoie l'appel à mesurer
+OPERATIONS = {
+    "gen_btree":       _generator("gen_btree"),
+    "gen_sidewinder":  _generator("gen_sidewinder"),
+    "gen_fusion":      _generator("gen_fusion"),
+    "gen_exploration": _generator("gen_exploration"),
+    "gen_wilson":      _generator("gen_wilson"),
+    "solve_dfs":       _solver("solve_dfs"),
+    "solve_bfs":       _solver("solve_bfs"),
+    "solve_rhr":       _solver("solve_rhr"),
+    "__str__":         _str,
+    "overlay":         _overlay,
+}
+
+
+def measure(operation, side, repeat, seed):
+    """
+    Mesure une opération sur un labyrinthe carré de côté 'side'.
+
+    Retour :
+        dictionnaire : cells, seconds (meilleur temps sur 'repeat' essais) et peak_bytes (pic de mémoire)
+    """
+    appel = OPERATIONS[operation](side, side, seed)
+    meilleur = math.inf
+    for _ in range(repeat):
+        debut = time.perf_counter()
+        appel()
+        meilleur = min(meilleur, time.perf_counter() - debut)
+    tracemalloc.start()
+    appel()
+    _, pic = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"cells": side * side, "seconds": meilleur, "peak_bytes": pic}
+
+
+def scaling_exponent(points):
+    """
+    Pente de la droite des moindres carrés de log(temps) en fonction de log(nombre de cellules).
+    """
+    xs = [math.log(p["cells"]) for p in points]
+    ys = [math.log(max(p["seconds"], 1e-9)) for p in points]
+    mx = sum(xs) / len(xs)
+    my = sum(ys) / len(ys)
+    variance = sum((x - mx) ** 2 for x in xs)
+    if variance == 0:
+        return 0.0
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / variance
+
+
+def run(operations, sizes, repeat, seed):
+    """
+    Mesure toutes les opérations demandées sur toutes les tailles.
+
+    Retour :
+        dictionnaire des résultats (sérialisable en JSON)
+    """
+    resultats = {}
+    for operation in operations:
+        points = [measure(operation, side, repeat, seed) for side in sizes]
+        resultats[operation] = {"points": points, "exponent": round(scaling_exponent(points), 3)}
+        print(f"{operation:16s} exposant {resultats[operation]['exponent']:5.2f}  "
+              f"{points[-1]['seconds']:.4f} s pour {points[-1]['cells']} cellules", file=sys.stderr)
+    return {"python": platform.python_version(), "seed": seed, "sizes": sizes, "results": resultats}
+
+
+def compare(resultats, reference, time_tolerance, exponent_tolerance):
+    """
+    Compare des résultats à une référence.
+
+    Retour :
+        liste des régressions (chaînes), vide si tout va bien
+    """
+    regressions = []
+    for operation, mesure in resultats["results"].items():
+        attendu = reference["results"].get(operation)
+        if attendu is None:
+            continue
+        if mesure["exponent"] > attendu["exponent"] + exponent_tolerance:
+            regressions.append(f"{operation} : exposant {mesure['exponent']} (référence {attendu['exponent']})")
+        temps_reference = {p["cells"]: p["seconds"] for p in attendu["points"]}
+        for point in mesure["points"]:
+            limite = temps_reference.get(point["cells"])
+            if limite is not None and point["seconds"] > limite * time_tolerance:
+                regressions.append(f"{operation} : {point['seconds']:.4f} s pour {point['cells']} cellules "
+                                   f"(référence {limite:.4f} s)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="côtés des labyrinthes mesurés")
+    parser.add_argument("--repeat", type=int, default=3, help="nombre d'essais par mesure (on garde le meilleur)")
+    parser.add_argument("--seed", type=int, default=2023, help="graine des labyrinthes")
+    parser.add_argument("--only", nargs="+", choices=sorted(OPERATIONS), help="opérations à mesurer")
+    parser.add_argument("--output", help="fichier JSON où écrire les résultats")
+    parser.add_argument("--baseline", help="fichier JSON de référence auquel comparer les résultats")
+    parser.add_argument("--save-baseline", action="store_true", help=f"enregistre les résultats dans {BASELINE}")
+    parser.add_argument("--time-tolerance", type=float, default=3.0,
+                        help="régression si un temps dépasse ce multiple du temps de référence")
+    parser.add_argument("--exponent-tolerance", type=float, default=0.3,
+                        help="régression si un exposant dépasse l'exposant de référence de plus de cette valeur")
+    args = parser.parse_args(argv)
+
+    resultats = run(args.only or list(OPERATIONS), args.sizes, args.repeat, args.seed)
+    texte = json.dumps(resultats, indent=2)
+    if args.output:
+        with open(args.output, "w") as fichier:
+            fichier.write(texte + "\n")
+    else:
+        print(texte)
+    if args.save_baseline:
+        with open(BASELINE, "w") as fichier:
+            fichier.write(texte + "\n")
+    if args.baseline:
+        with open(args.baseline) as fichier:
+            reference = json.load(fichier)
+        regressions = compare(resultats, reference, args.time_tolerance, args.exponent_tolerance)
+        for regression in regressions:
+            print("RÉGRESSION :", regression, file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())